@@ -19,11 +19,103 @@ Dependencies:
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
+import mmap
+import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+
+# C-level serializer when available; output is identical to the stdlib
+# fallback (sorted keys, two-space indent) so badges stay deterministic
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None  # type: ignore[assignment]
+
+# Prefer lxml's libxml2-backed parser: CI reports (JUnit XML from large suites,
+# Cobertura) can reach megabytes, and lxml parses them significantly faster and
+# with less memory than the stdlib tree builder. Entity resolution is disabled
+# to match the XXE-safety guarantees defusedxml provides; fall back to
+# defusedxml when lxml is not installed.
+try:
+    from lxml import etree as ET  # noqa: N812
+
+    _LXML_PARSER: ET.XMLParser | None = ET.XMLParser(
+        resolve_entities=False,
+        huge_tree=False,
+        no_network=True,
+    )
+    _PARSE_ERRORS: tuple[type[Exception], ...] = (ET.XMLSyntaxError,)
+except ImportError:  # pragma: no cover - exercised when lxml is absent
+    import defusedxml.ElementTree as ET  # noqa: N817
+
+    _LXML_PARSER = None
+    _PARSE_ERRORS = (ET.ParseError,)
+
+
+# Parsed-report cache: CI matrix jobs and re-runs parse the same downloaded
+# artifacts repeatedly; a hit costs one stat + one small json.load instead of
+# a full XML/LCOV walk. Entries are invalidated by (size, mtime_ns).
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "badge-json"
+)
+
+
+def _disk_cached(func: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Cache a parser's result on disk, keyed by the input file's size+mtime."""
+
+    @functools.wraps(func)
+    def wrapper(path: str) -> Any:
+        cache_file = None
+        key = None
+        try:
+            st = os.stat(path)
+            key = [st.st_size, st.st_mtime_ns]
+            digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()
+            cache_file = _CACHE_DIR / f"{func.__name__}-{digest}.json"
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached.get("key") == key:
+                return cached["value"]
+        except (OSError, ValueError):
+            pass  # Missing/stale/corrupt cache entry - fall through to parse
+
+        result = func(path)
 
-import defusedxml.ElementTree as ET  # noqa: N817
+        if cache_file is not None:
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(
+                    json.dumps({"key": key, "value": result}), encoding="utf-8"
+                )
+            except OSError:
+                pass  # Cache is best-effort; never fail the parse over it
+
+        return result
+
+    return wrapper
+
+
+def _parse_xml_root(path: Path) -> object:
+    """Parse an XML file and return its root element.
+
+    Uses the hardened lxml parser when available, otherwise defusedxml.
+
+    Raises:
+        ValueError: If the XML is malformed
+    """
+    try:
+        if _LXML_PARSER is not None:
+            tree = ET.parse(str(path), _LXML_PARSER)
+        else:
+            tree = ET.parse(path)
+    except _PARSE_ERRORS as e:
+        raise ValueError(f"Malformed XML in {path}: {e}") from e
+    return tree.getroot()
 
 # Disallowed path prefixes (absolute paths that should never be accessed)
 # These are sensitive system directories that artifact paths should never resolve to
@@ -108,6 +200,7 @@ def validate_path_bounds(
     return resolved
 
 
+@_disk_cached
 def parse_coverage_xml(path: str) -> float:
     """Extract line coverage percentage from Cobertura XML.
 
@@ -125,11 +218,7 @@ def parse_coverage_xml(path: str) -> float:
     if not coverage_path.exists():
         raise FileNotFoundError(f"Coverage file not found: {path}")
 
-    try:
-        tree = ET.parse(coverage_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML in {path}: {e}") from e
+    root = _parse_xml_root(coverage_path)
 
     line_rate = root.get("line-rate")
     if line_rate is None:
@@ -146,6 +235,30 @@ def parse_coverage_xml(path: str) -> float:
     return coverage_pct
 
 
+def _sum_lcov_records(buf: bytes | mmap.mmap, marker: bytes) -> int:
+    """Sum the integer values of every LCOV record starting with ``marker``.
+
+    Only matches at the start of a line; the value runs to end of line.
+
+    Raises:
+        ValueError: If a record value is not an integer
+    """
+    total = 0
+    find = buf.find
+    marker_len = len(marker)
+    size = len(buf)
+    pos = find(marker)
+    while pos != -1:
+        if pos == 0 or buf[pos - 1] in (0x0A, 0x0D):
+            end = find(b"\n", pos)
+            if end == -1:
+                end = size
+            total += int(buf[pos + marker_len : end])
+        pos = find(marker, pos + marker_len)
+    return total
+
+
+@_disk_cached
 def parse_lcov(path: str) -> float:
     """Extract line coverage percentage from LCOV info file.
 
@@ -163,18 +276,21 @@ def parse_lcov(path: str) -> float:
     if not lcov_path.exists():
         raise FileNotFoundError(f"LCOV file not found: {path}")
 
-    lines_found = 0
-    lines_hit = 0
-
+    # LCOV is line-oriented ASCII; only the LF:/LH: records matter here.
+    # mmap the file and scan for those markers at byte level instead of
+    # decoding and strip/splitting every DA:/SF: line in between.
     try:
-        with open(lcov_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith("LF:"):
-                    lines_found += int(line.split(":")[1])
-                elif line.startswith("LH:"):
-                    lines_hit += int(line.split(":")[1])
-    except (ValueError, IndexError) as e:
+        with open(lcov_path, "rb") as f:
+            try:
+                buf: bytes | mmap.mmap = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # Empty files cannot be mmapped
+                buf = b""
+            lines_found = _sum_lcov_records(buf, b"LF:")
+            lines_hit = _sum_lcov_records(buf, b"LH:")
+    except ValueError as e:
         raise ValueError(f"Malformed LCOV file {path}: {e}") from e
 
     if lines_found == 0:
@@ -189,6 +305,22 @@ def parse_lcov(path: str) -> float:
     return coverage_pct
 
 
+# The four <testsuite> counters read by parse_junit_xml, extracted in one place
+_SUITE_ATTRS = ("tests", "failures", "errors", "skipped")
+
+
+def _suite_counts(elem: object) -> tuple[int, int, int, int]:
+    """Read the (tests, failures, errors, skipped) attributes of a testsuite."""
+    get = elem.get  # type: ignore[attr-defined]
+    return (
+        int(get(_SUITE_ATTRS[0], 0)),
+        int(get(_SUITE_ATTRS[1], 0)),
+        int(get(_SUITE_ATTRS[2], 0)),
+        int(get(_SUITE_ATTRS[3], 0)),
+    )
+
+
+@_disk_cached
 def parse_junit_xml(path: str) -> dict[str, str | int]:
     """Extract test counts from JUnit XML file.
 
@@ -206,29 +338,57 @@ def parse_junit_xml(path: str) -> dict[str, str | int]:
     if not junit_path.exists():
         raise FileNotFoundError(f"JUnit XML file not found: {path}")
 
+    # Stream with iterparse instead of building the full DOM: the counts we
+    # need live on <testsuite> start-tag attributes, so the (potentially
+    # thousands of) child <testcase> elements never need to be retained.
+    tests = failures = errors = skipped = 0
+    root_tag: str | None = None
+    saw_suite = False
+    depth = 0
+
     try:
-        tree = ET.parse(junit_path)
-        root = tree.getroot()
-    except ET.ParseError as e:
+        if _LXML_PARSER is not None:
+            events = ET.iterparse(
+                str(junit_path),
+                events=("start", "end"),
+                resolve_entities=False,
+                huge_tree=False,
+                no_network=True,
+            )
+        else:
+            events = ET.iterparse(junit_path, events=("start", "end"))
+
+        for event, elem in events:
+            if event == "end":
+                depth -= 1
+                elem.clear()
+                continue
+
+            if root_tag is None:
+                root_tag = elem.tag
+                if root_tag == "testsuite":
+                    # Single-suite file: the root carries all the counts, so
+                    # there is no need to walk its children at all.
+                    tests, failures, errors, skipped = _suite_counts(elem)
+                    saw_suite = True
+                    break
+                if root_tag != "testsuites":
+                    raise ValueError(
+                        f"Unexpected root element in {path}: {root_tag}"
+                    )
+            elif depth == 1 and elem.tag == "testsuite":
+                t, f, e, s = _suite_counts(elem)
+                tests += t
+                failures += f
+                errors += e
+                skipped += s
+                saw_suite = True
+            depth += 1
+    except _PARSE_ERRORS as e:
         raise ValueError(f"Malformed XML in {path}: {e}") from e
 
-    # Handle both <testsuites> (wrapper) and <testsuite> (direct)
-    if root.tag == "testsuites":
-        testsuites = root.findall("testsuite")
-        if not testsuites:
-            raise ValueError(f"No testsuite elements found in {path}")
-
-        tests = sum(int(ts.get("tests", 0)) for ts in testsuites)
-        failures = sum(int(ts.get("failures", 0)) for ts in testsuites)
-        errors = sum(int(ts.get("errors", 0)) for ts in testsuites)
-        skipped = sum(int(ts.get("skipped", 0)) for ts in testsuites)
-    elif root.tag == "testsuite":
-        tests = int(root.get("tests", 0))
-        failures = int(root.get("failures", 0))
-        errors = int(root.get("errors", 0))
-        skipped = int(root.get("skipped", 0))
-    else:
-        raise ValueError(f"Unexpected root element in {path}: {root.tag}")
+    if not saw_suite:
+        raise ValueError(f"No testsuite elements found in {path}")
 
     passed = tests - failures - errors - skipped
 
@@ -281,7 +441,11 @@ def generate_status_json(
         },
     }
 
-    # sort_keys=True ensures deterministic output
+    # Sorted keys ensure deterministic output
+    if orjson is not None:
+        return orjson.dumps(
+            status, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
+        ).decode()
     return json.dumps(status, indent=2, sort_keys=True)
 
 
@@ -347,11 +511,19 @@ def main() -> int:
             label="TypeScript tests",
         )
 
-        # Parse all inputs (using validated paths)
-        python_coverage = parse_coverage_xml(str(python_cov_path))
-        python_tests = parse_junit_xml(str(python_test_path))
-        ts_coverage = parse_lcov(str(ts_cov_path))
-        ts_tests = parse_junit_xml(str(ts_test_path))
+        # Parse all inputs (using validated paths). The four reports are
+        # independent, so parse them concurrently; lxml and mmap scanning
+        # release the GIL during the C-level work.
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            python_cov_future = pool.submit(parse_coverage_xml, str(python_cov_path))
+            python_test_future = pool.submit(parse_junit_xml, str(python_test_path))
+            ts_cov_future = pool.submit(parse_lcov, str(ts_cov_path))
+            ts_test_future = pool.submit(parse_junit_xml, str(ts_test_path))
+
+            python_coverage = python_cov_future.result()
+            python_tests = python_test_future.result()
+            ts_coverage = ts_cov_future.result()
+            ts_tests = ts_test_future.result()
 
         # Generate JSON
         json_output = generate_status_json(
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Verify badge JSON is accessible at the raw GitHub URL.
 
-Retries up to 12 times (60 seconds) to allow for GitHub raw content propagation.
+Retries with exponential backoff (~60 seconds total) to allow for GitHub raw
+content propagation.
 
 Usage:
     BADGE_URL=https://raw.githubusercontent.com/... python verify-badge-url.py
@@ -14,15 +15,31 @@ import os
 import re
 import sys
 import time
-import urllib.error
-import urllib.request
 from urllib.parse import urlparse
 
+import requests
+
+# orjson decodes straight from bytes in C; fall back to stdlib json when it
+# is not installed (both raise ValueError subclasses on malformed input)
+try:
+    import orjson
+
+    def _loads(body: bytes) -> object:
+        return orjson.loads(body)
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+
+    def _loads(body: bytes) -> object:
+        return json.loads(body)
+
+
 # Timeout configuration (seconds)
-# Note: urllib.request.urlopen uses a single timeout for the entire operation
-# (connect + read). For finer control, consider using requests library.
 URL_TIMEOUT_SECONDS = 10
 
+# Delay before each retry (seconds). Ramps up so fast propagation is caught
+# within a couple of seconds while the total budget stays at ~60s.
+BACKOFF_SCHEDULE = (1, 1, 2, 2, 3, 5, 8, 13, 13, 12)
+
 # Allowed URL pattern: raw GitHub content for badges branch
 # Format: https://raw.githubusercontent.com/{owner}/{repo}/badges/status.json
 ALLOWED_HOST = "raw.githubusercontent.com"
@@ -112,30 +129,54 @@ def main() -> int:
     print(f"Verifying badge JSON at: {url}")
     print(f"Timeout: {URL_TIMEOUT_SECONDS}s per attempt")
 
-    for i in range(1, 13):
+    # One session for all attempts: retries reuse the same keep-alive TLS
+    # connection instead of paying a fresh TCP+TLS handshake per attempt
+    session = requests.Session()
+
+    attempts = len(BACKOFF_SCHEDULE) + 1
+    for i in range(1, attempts + 1):
         try:
-            # Safe: URL validated above with strict allowlist
-            with urllib.request.urlopen(url, timeout=URL_TIMEOUT_SECONDS) as response:  # noqa: S310
-                data = json.load(response)
-                if "python" in data and "coverage" in data["python"]:
+            # Cheap HEAD probe first: while the content is still propagating
+            # there is no point downloading and parsing the body
+            probe = session.head(url, timeout=URL_TIMEOUT_SECONDS)
+            if probe.status_code != 200:
+                print(f"HTTP {probe.status_code}: {probe.reason}")
+            else:
+                # Safe: URL validated above with strict allowlist
+                response = session.get(url, timeout=URL_TIMEOUT_SECONDS)
+                response.raise_for_status()
+                # Decode the body bytes directly rather than going through
+                # response.json()'s charset detection and text decoding
+                data = _loads(response.content)
+                if (
+                    isinstance(data, dict)
+                    and "python" in data
+                    and "coverage" in data["python"]
+                ):
                     print("[OK] Badge JSON accessible and valid")
                     print(json.dumps(data, indent=2))
                     return 0
                 else:
                     print(f"Invalid JSON structure: {data}")
-        except urllib.error.HTTPError as e:
-            print(f"HTTP {e.code}: {e.reason}")
-        except urllib.error.URLError as e:
-            print(f"URL error: {e.reason}")
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error: {e}")
-        except TimeoutError:
+        except requests.HTTPError as e:
+            print(f"HTTP {e.response.status_code}: {e.response.reason}")
+        except requests.Timeout:
             print(f"Request timed out after {URL_TIMEOUT_SECONDS}s")
+        except ValueError as e:
+            # Both orjson and stdlib json raise ValueError subclasses
+            print(f"JSON decode error: {e}")
+        except requests.RequestException as e:
+            print(f"URL error: {e}")
         except Exception as e:
             print(f"Error: {e}")
 
-        print(f"Waiting for raw content propagation... ({i}/12)")
-        time.sleep(5)
+        if i < attempts:
+            delay = BACKOFF_SCHEDULE[i - 1]
+            print(
+                f"Waiting {delay}s for raw content propagation... "
+                f"({i}/{attempts})"
+            )
+            time.sleep(delay)
 
     print("::error::Badge JSON not accessible after 60s", file=sys.stderr)
     return 1
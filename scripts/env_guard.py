@@ -12,11 +12,13 @@ Security properties:
 - No silent bypasses: file errors cause immediate failure
 """
 
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Environment variables to protect from accidental commits
 PROTECTED_VARS = ["ADO_PAT", "OPENAI_API_KEY", "AZURE_DEVOPS_TOKEN"]
@@ -59,6 +61,54 @@ def validate_git() -> str:
     return git_path
 
 
+def staged_files(git_path: str) -> list[str]:
+    """List staged files once for the whole run.
+
+    Uses NUL separation so filenames with spaces or non-ASCII characters
+    are returned verbatim, and excludes deletions (there is no file on
+    disk to scan for a deleted path).
+
+    Args:
+        git_path: Validated git executable path
+
+    Returns:
+        Staged file paths relative to the repository root
+    """
+    # S603: git_path is validated by validate_git()
+    result = subprocess.run(  # noqa: S603
+        [git_path, "diff", "--cached", "--name-only", "--diff-filter=d", "-z"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return [file for file in result.stdout.split("\0") if file]
+
+
+def _scan_file(file: str, pattern: re.Pattern[bytes]) -> bytes | None:
+    """Scan a single file for the combined secret pattern.
+
+    Args:
+        file: Path to the staged file
+        pattern: Compiled byte pattern of all protected values
+
+    Returns:
+        The matched secret bytes, or None if the file is clean
+
+    Raises:
+        OSError: If the file cannot be read (caller fails closed)
+    """
+    with open(file, "rb") as f:
+        try:
+            content: bytes | mmap.mmap = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files cannot be mmapped; nothing to scan
+            content = b""
+        match = pattern.search(content)
+    return match.group() if match else None
+
+
 def main() -> int:
     """Check staged files for environment variable values.
 
@@ -70,28 +120,48 @@ def main() -> int:
     # Validate git executable via behavior check
     git_path = validate_git()
 
+    # Compile all protected values into one alternation pattern so each file
+    # is scanned exactly once for every secret (re runs a single automaton
+    # over the content instead of one substring search per variable).
+    secrets = {}
     for var in PROTECTED_VARS:
         value = os.environ.get(var)
         # Skip if not set or too short to be meaningful
-        if not value or len(value) < 8:
-            continue
-
-        # Get list of staged files (S603: git_path is validated above)
-        result = subprocess.run(  # noqa: S603
-            [git_path, "diff", "--cached", "--name-only"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        for file in result.stdout.strip().split("\n"):
-            if not file or not os.path.isfile(file):
-                continue
+        if value and len(value) >= 8:
+            secrets[var] = value
+
+    if not secrets:
+        return 0
+
+    # Match on bytes: staged files are scanned without decoding, which both
+    # skips the UTF-8 decode pass and lets binary files be checked instead
+    # of blocking the commit.
+    pattern = re.compile(
+        b"|".join(re.escape(value.encode("utf-8")) for value in secrets.values())
+    )
+
+    # No isfile() prefilter: the diff listing already excludes deletions, so
+    # open() is attempted directly and the rare non-regular entry is handled
+    # below - one stat syscall saved per staged file.
+    files = staged_files(git_path)
+    if not files:
+        return 0
+
+    # Scanning is I/O-bound (open + mmap per file); a small thread pool
+    # overlaps the reads without spawning a thread per staged file.
+    max_workers = min(8, os.cpu_count() or 1, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_scan_file, file, pattern): file for file in files}
+        for future in as_completed(futures):
+            file = futures[future]
 
             # Fail-closed: any file error causes immediate exit
             try:
-                with open(file, encoding="utf-8") as f:
-                    content = f.read()
+                matched = future.result()
+            except IsADirectoryError:
+                # Submodule entries show up in the diff but have no blob
+                # content on disk to scan
+                continue
             except FileNotFoundError:
                 print(f"::error::File not found (deleted?): {file}")
                 print("  Commit blocked: cannot verify file is secret-free")
@@ -100,17 +170,19 @@ def main() -> int:
                 print(f"::error::Permission denied: {file}")
                 print("  Commit blocked: cannot verify file is secret-free")
                 return 1
-            except UnicodeDecodeError:
-                print(f"::error::Cannot decode file (binary?): {file}")
-                print("  Commit blocked: cannot verify file is secret-free")
-                return 1
             except OSError as e:
                 print(f"::error::Cannot read file {file}: {e}")
                 print("  Commit blocked: cannot verify file is secret-free")
                 return 1
 
-            if value in content:
-                print(f"::error::{var} value found in {file}")
+            if matched:
+                matched_value = matched.decode("utf-8")
+                matched_var = next(
+                    var
+                    for var, value in secrets.items()
+                    if value == matched_value
+                )
+                print(f"::error::{matched_var} value found in {file}")
                 print("  Commit blocked to prevent secret exposure.")
                 print("  Remove the secret value and try again.")
                 return 1
@@ -456,23 +456,25 @@ class ADOClient:
 
     # Phase 3.4: PR Threads/Comments extraction
 
-    def get_pr_threads(
+    def iter_pr_threads(
         self,
         project: str,
         repository_id: str,
         pull_request_id: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch all threads for a pull request.
+    ) -> Iterator[dict[str, Any]]:
+        """Yield threads for a pull request, fetching pages lazily.
 
         §6: Incremental strategy - caller should filter by lastUpdatedDate.
+        A caller that stops consuming (e.g. a max-threads cap) stops
+        further page fetches, reducing rate-limit pressure.
 
         Args:
             project: Project name.
             repository_id: Repository ID.
             pull_request_id: PR ID.
 
-        Returns:
-            List of thread dictionaries.
+        Yields:
+            Thread dictionaries in API order.
 
         Raises:
             ExtractionError: If thread fetch fails.
@@ -483,7 +485,7 @@ class ADOClient:
             f"?api-version={self.config.version}"
         )
 
-        all_threads: list[dict[str, Any]] = []
+        fetched = 0
         continuation_token: str | None = None
 
         while True:
@@ -507,19 +509,44 @@ class ADOClient:
                 continuation_token = extract_continuation_token(response)
                 data = response.json()
                 threads = data.get("value", [])
-                all_threads.extend(threads)
-
-                if not continuation_token:
-                    break
 
             except (RequestException, HTTPError, json.JSONDecodeError) as e:
                 raise ExtractionError(
                     f"Failed to fetch threads for PR {pull_request_id}: {e}"
                 ) from e
 
+            fetched += len(threads)
+            yield from threads
+
+            if not continuation_token:
+                break
+
             time.sleep(self.config.rate_limit_sleep_seconds)
 
         logger.debug(
-            f"Fetched {len(all_threads)} threads for PR {repository_id}/{pull_request_id}"
+            f"Fetched {fetched} threads for PR {repository_id}/{pull_request_id}"
         )
-        return all_threads
+
+    def get_pr_threads(
+        self,
+        project: str,
+        repository_id: str,
+        pull_request_id: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch all threads for a pull request.
+
+        Back-compat wrapper around iter_pr_threads that materializes every
+        page.
+
+        Args:
+            project: Project name.
+            repository_id: Repository ID.
+            pull_request_id: PR ID.
+
+        Returns:
+            List of thread dictionaries.
+
+        Raises:
+            ExtractionError: If thread fetch fails.
+        """
+        return list(self.iter_pr_threads(project, repository_id, pull_request_id))
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
@@ -27,8 +28,6 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 import pandas as pd
 
-from .date_utils import align_to_monday
-
 if TYPE_CHECKING:
     from ..persistence.database import DatabaseManager
 
@@ -49,10 +48,17 @@ OUTLIER_STD_THRESHOLD = 3.0
 
 # Metric definitions (same as ProphetForecaster)
 # Note: review_time_minutes removed - it used cycle_time as misleading proxy
-METRICS = [
+METRICS = (
     ("pr_throughput", "count"),
     ("cycle_time_minutes", "minutes"),
-]
+)
+
+# Metric name -> weekly-aggregate column, built once at import instead of
+# per _forecast_metric call
+_COLUMN_MAP = {
+    "pr_throughput": "pr_count",
+    "cycle_time_minutes": "cycle_time_p50",
+}
 
 # Status enum values for forecast results
 STATUS_OK = "ok"
@@ -75,6 +81,12 @@ CONSTRAINT_OUTLIER_CLIPPED = "outlier_clipped"
 # Fallback margin for upper bound when prediction is zero or near-zero
 DEFAULT_UPPER_BOUND_MARGIN = 100.0
 
+# Aggregated weekly metrics keyed on the database file's identity and
+# version, so repeated generate() calls in one process skip the SQL query
+# and pandas aggregation when nothing has been written in between.
+_WEEKLY_METRICS_CACHE: dict[tuple[str, int, int, int, int], pd.DataFrame] = {}
+_WEEKLY_METRICS_CACHE_MAX = 4
+
 
 @dataclass
 class DataQualityAssessment:
@@ -173,9 +185,11 @@ def safe_clip_outliers(
     if detect_constant_series(finite_values):
         return values, None, False
 
-    # Compute stats on finite values only
-    mean = float(np.nanmean(finite_values))
-    std = float(np.nanstd(finite_values))
+    # Compute stats on finite values only. finite_values is NaN-free by
+    # construction, so the plain single-pass reductions suffice - the
+    # nan-aware variants pay for mask handling this path never needs.
+    mean = float(finite_values.mean())
+    std = float(finite_values.std())
 
     # Safety check for undefined stats
     if not np.isfinite(mean) or not np.isfinite(std) or std == 0:
@@ -255,6 +269,10 @@ class FallbackForecaster:
         self._data_quality: DataQualityAssessment | None = None
         self._status: str = STATUS_OK
         self._reason_code: str | None = None
+        # Per-run clock snapshot so every forecast and the manifest share
+        # one consistent timestamp (set at the top of generate())
+        self._run_date: date | None = None
+        self._run_ts: datetime | None = None
 
     @property
     def data_quality(self) -> DataQualityAssessment | None:
@@ -290,6 +308,25 @@ class FallbackForecaster:
         # Reset status for this run
         self._status = STATUS_OK
         self._reason_code = None
+        self._run_date = date.today()
+        self._run_ts = datetime.now(timezone.utc)
+
+        # Cheap pre-check: one COUNT of distinct weeks settles the
+        # insufficient-data verdict without fetching and aggregating rows
+        weeks_hint = self._count_weeks_available()
+        if weeks_hint is not None and weeks_hint < MIN_WEEKS_REQUIRED:
+            self._data_quality = assess_data_quality(weeks_hint)
+            logger.info(
+                f"Insufficient data for predictions - {self._data_quality.message}"
+            )
+            self._status = STATUS_INSUFFICIENT_DATA
+            self._reason_code = REASON_TOO_FEW_WEEKS
+            return self._write_predictions(
+                forecasts=[],
+                data_quality=self._data_quality.status,
+                status=self._status,
+                reason_code=self._reason_code,
+            )
 
         # Get weekly metrics from database
         df = self._get_weekly_metrics()
@@ -358,49 +395,122 @@ class FallbackForecaster:
             reason_code=self._reason_code,
         )
 
+    def _count_weeks_available(self) -> int | None:
+        """Count distinct completed-PR weeks with a single aggregate query.
+
+        Only runs against a real database file (the same guard the weekly
+        cache uses) - mocked managers return None, meaning "unknown", and
+        the caller falls through to the full fetch.
+        """
+        import sqlite3
+
+        if self._weekly_metrics_cache_key() is None:
+            return None
+        try:
+            cursor = self.db.execute(
+                """
+                SELECT COUNT(DISTINCT date(closed_date, '-6 days', 'weekday 1'))
+                FROM pull_requests
+                WHERE closed_date IS NOT NULL AND status = 'completed'
+                """
+            )
+            row = cursor.fetchone()
+        except sqlite3.Error:
+            return None
+        return int(row[0]) if row is not None else 0
+
+    def _weekly_metrics_cache_key(self) -> tuple[str, int, int, int, int] | None:
+        """Build a cache key identifying the database file's current version.
+
+        Includes the -wal file's stat because under WAL mode writes land
+        there first - the main file alone can look unchanged after an
+        extract. Returns None (no caching) when the database path is not a
+        real file, e.g. tests driving the forecaster with a mocked manager.
+        """
+        db_path = getattr(self.db, "db_path", None)
+        if not isinstance(db_path, Path):
+            return None
+        try:
+            st = os.stat(db_path)
+        except OSError:
+            return None
+        try:
+            wal = os.stat(f"{db_path}-wal")
+            wal_mtime, wal_size = wal.st_mtime_ns, wal.st_size
+        except OSError:
+            wal_mtime, wal_size = 0, 0
+        return (str(db_path), st.st_mtime_ns, st.st_size, wal_mtime, wal_size)
+
     def _get_weekly_metrics(self) -> pd.DataFrame:
         """Get weekly metrics from database.
 
+        Results are memoized per database version: callers treat the frame
+        as read-only, so repeated generate() calls between extracts reuse
+        the aggregate instead of re-running the query and groupby.
+
         Returns:
             DataFrame with columns: week_start, pr_count, cycle_time_p50
         """
+        cache_key = self._weekly_metrics_cache_key()
+        if cache_key is not None:
+            cached = _WEEKLY_METRICS_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        # No ORDER BY: rows are regrouped and sorted by week_start below, so
+        # a SQL-side sort on closed_date would be thrown away. Full SQL
+        # aggregation is deliberately not used - SQLite has no built-in
+        # median, and a Python UDF would run per row anyway.
         query = """
             SELECT
                 closed_date,
                 cycle_time_minutes
             FROM pull_requests
             WHERE closed_date IS NOT NULL AND status = 'completed'
-            ORDER BY closed_date
         """
         df = pd.read_sql_query(query, self.db.connection)
 
         if df.empty:
-            return pd.DataFrame()
+            return self._cache_weekly_metrics(cache_key, pd.DataFrame())
 
-        # Convert to datetime and group by ISO week
+        # Compute each PR's week start (Monday) vectorized: subtracting the
+        # weekday offset lands every row on its ISO week's Monday, which is
+        # exactly what the former isocalendar groupby + per-row
+        # align_to_monday(date.fromisocalendar(...)) apply produced - without
+        # the row-at-a-time Python calls.
         df["closed_dt"] = pd.to_datetime(df["closed_date"])
-        df["iso_year"] = df["closed_dt"].dt.isocalendar().year
-        df["iso_week"] = df["closed_dt"].dt.isocalendar().week
+        df["week_start"] = (
+            (df["closed_dt"] - pd.to_timedelta(df["closed_dt"].dt.weekday, unit="D"))
+            .dt.normalize()
+            .dt.date
+        )
 
         # Aggregate by week
         weekly = (
-            df.groupby(["iso_year", "iso_week"])
+            df.groupby("week_start")
             .agg(
                 pr_count=("closed_date", "count"),
-                cycle_time_p50=("cycle_time_minutes", lambda x: x.quantile(0.5)),
+                # "median" dispatches to the Cython groupby fast path and
+                # matches quantile(0.5) semantics, including NaN skipping
+                cycle_time_p50=("cycle_time_minutes", "median"),
             )
             .reset_index()
         )
 
-        # Calculate week start date (Monday) using dedicated utility
-        weekly["week_start"] = weekly.apply(
-            lambda row: align_to_monday(
-                date.fromisocalendar(int(row["iso_year"]), int(row["iso_week"]), 1)
-            ),
-            axis=1,
-        )
-
-        return weekly.sort_values("week_start").reset_index(drop=True)
+        weekly = weekly.sort_values("week_start").reset_index(drop=True)
+        return self._cache_weekly_metrics(cache_key, weekly)
+
+    @staticmethod
+    def _cache_weekly_metrics(
+        cache_key: tuple[str, int, int, int, int] | None,
+        weekly: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """Store the aggregate under its database-version key (if cacheable)."""
+        if cache_key is not None:
+            if len(_WEEKLY_METRICS_CACHE) >= _WEEKLY_METRICS_CACHE_MAX:
+                # Evict the oldest entry; dicts preserve insertion order
+                _WEEKLY_METRICS_CACHE.pop(next(iter(_WEEKLY_METRICS_CACHE)))
+            _WEEKLY_METRICS_CACHE[cache_key] = weekly
+        return weekly
 
     def _forecast_metric(
         self,
@@ -421,18 +531,13 @@ class FallbackForecaster:
         Returns:
             Tuple of (forecast dict or None, reason_code or None).
         """
-        # Map metric to column
-        column_map = {
-            "pr_throughput": "pr_count",
-            "cycle_time_minutes": "cycle_time_p50",
-        }
-
-        column = column_map.get(metric)
+        column = _COLUMN_MAP.get(metric)
         if column not in df.columns:
             return None, None
 
-        # Get raw values
-        y_values = df[column].values.astype(float)
+        # Get raw values; to_numpy with copy=False reuses the column's
+        # buffer when it is already float64 instead of always copying
+        y_values = df[column].to_numpy(dtype=np.float64, copy=False)
 
         # Filter to finite values first
         finite_mask = np.isfinite(y_values)
@@ -476,12 +581,18 @@ class FallbackForecaster:
             )
             return None, REASON_TOO_FEW_WEEKS
 
-        # Perform linear regression
+        # Perform linear regression via closed-form OLS: for a degree-1 fit
+        # on a few dozen points the slope/intercept formulas give the same
+        # least-squares answer as np.polyfit without building a Vandermonde
+        # matrix and calling into LAPACK.
         x_values = np.arange(len(y_final))
-        coeffs = np.polyfit(x_values, y_final, 1)  # slope, intercept
+        x_centered = x_values - x_values.mean()
+        y_mean = float(y_final.mean())
+        slope = float((x_centered * (y_final - y_mean)).sum() / (x_centered**2).sum())
+        intercept = y_mean - slope * float(x_values.mean())
 
         # Calculate residual standard error for confidence bands
-        predicted_historical = np.polyval(coeffs, x_values)
+        predicted_historical = slope * x_values + intercept
         residuals = y_final - predicted_historical
         residual_se = float(np.std(residuals, ddof=1)) if len(residuals) > 1 else 0.0
 
@@ -492,7 +603,7 @@ class FallbackForecaster:
 
         # Generate future predictions
         horizon = self._calculate_horizon()
-        today = date.today()
+        today = self._run_date or date.today()
         next_monday = today + timedelta(days=(7 - today.weekday()) % 7)
         if today.weekday() == 0:
             next_monday = today
@@ -500,13 +611,20 @@ class FallbackForecaster:
         values: list[dict[str, Any]] = []
         any_floor_applied = False
 
+        # Loop-invariant and vectorizable pieces hoisted out of the loop:
+        # one NumPy evaluation covers every future point, and the margin
+        # does not change per point. The constraint bookkeeping below stays
+        # per point - it builds a distinct constraints_applied list per entry.
+        margin = confidence_multiplier * residual_se
+        future_x = np.arange(len(y_final), len(y_final) + horizon)
+        predicted_future = slope * future_x + intercept
+
         for i in range(horizon):
-            future_x = len(y_final) + i
-            predicted = float(np.polyval(coeffs, future_x))
-            margin = confidence_multiplier * residual_se
+            predicted = float(predicted_future[i])
 
+            # next_monday is Monday by construction and adding whole weeks
+            # preserves the weekday, so no re-alignment is needed
             period_start = next_monday + timedelta(weeks=i)
-            period_start = align_to_monday(period_start)
 
             # Track constraints applied to this prediction
             constraints_applied: list[str] = []
@@ -574,15 +692,16 @@ class FallbackForecaster:
             Forecast dict with identical predicted/lower/upper values.
         """
         horizon = self._calculate_horizon()
-        today = date.today()
+        today = self._run_date or date.today()
         next_monday = today + timedelta(days=(7 - today.weekday()) % 7)
         if today.weekday() == 0:
             next_monday = today
 
         values: list[dict[str, Any]] = []
         for i in range(horizon):
+            # next_monday is Monday by construction and adding whole weeks
+            # preserves the weekday, so no re-alignment is needed
             period_start = next_monday + timedelta(weeks=i)
-            period_start = align_to_monday(period_start)
 
             values.append(
                 {
@@ -655,7 +774,7 @@ class FallbackForecaster:
 
         predictions = {
             "schema_version": PREDICTIONS_SCHEMA_VERSION,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": (self._run_ts or datetime.now(timezone.utc)).isoformat(),
             "is_stub": False,
             "generated_by": GENERATOR_ID,
             "forecaster": "linear",
@@ -666,11 +785,41 @@ class FallbackForecaster:
         }
 
         file_path = predictions_dir / "trends.json"
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(predictions, f, indent=2, sort_keys=True, ensure_ascii=False)
+        if self._predictions_unchanged(file_path, predictions):
+            logger.info("predictions/trends.json unchanged - skipping rewrite")
+            return True
+        # Serialize to one string and write it in a single call - json.dump
+        # streams many small chunks through the text-file wrapper. sort_keys
+        # stays: deterministic output is part of the golden-file contract.
+        file_path.write_text(
+            json.dumps(predictions, indent=2, sort_keys=True, ensure_ascii=False),
+            encoding="utf-8",
+        )
 
         logger.info(
             f"Generated predictions/trends.json with {len(forecasts)} metrics "
             f"(forecaster: linear, quality: {data_quality}, status: {status})"
         )
         return True
+
+    @staticmethod
+    def _predictions_unchanged(
+        file_path: Path, predictions: dict[str, Any]
+    ) -> bool:
+        """Check whether an existing trends.json already holds this payload.
+
+        generated_at is a fresh timestamp every run, so a byte-for-byte
+        compare would never match; everything else in the payload is
+        deterministic, so comparing the parsed documents minus that field
+        detects a genuinely unchanged forecast and lets the caller skip
+        the rewrite. Any read or parse problem counts as changed.
+        """
+        try:
+            existing = json.loads(file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(existing, dict):
+            return False
+        return {k: v for k, v in existing.items() if k != "generated_at"} == {
+            k: v for k, v in predictions.items() if k != "generated_at"
+        }
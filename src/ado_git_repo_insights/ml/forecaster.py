@@ -24,10 +24,17 @@ HORIZON_WEEKS = 4
 
 # Metric definitions
 # Note: review_time_minutes removed - it used cycle_time as misleading proxy
-METRICS = [
+METRICS = (
     ("pr_throughput", "count"),
     ("cycle_time_minutes", "minutes"),
-]
+)
+
+# Metric name -> weekly-aggregate column, built once at import instead of
+# per _forecast_metric call
+_COLUMN_MAP = {
+    "pr_throughput": "pr_count",
+    "cycle_time_minutes": "cycle_time_p50",
+}
 
 
 @dataclass
@@ -147,29 +154,26 @@ class ProphetForecaster:
         if df.empty:
             return pd.DataFrame()
 
-        # Convert to datetime and group by ISO week
+        # Compute each PR's week start (Monday) vectorized - subtracting the
+        # weekday offset lands every row on its ISO week's Monday, matching
+        # the former isocalendar groupby + per-row align_to_monday apply
         df["closed_dt"] = pd.to_datetime(df["closed_date"])
-        df["iso_year"] = df["closed_dt"].dt.isocalendar().year
-        df["iso_week"] = df["closed_dt"].dt.isocalendar().week
+        df["week_start"] = (
+            (df["closed_dt"] - pd.to_timedelta(df["closed_dt"].dt.weekday, unit="D"))
+            .dt.normalize()
+            .dt.date
+        )
 
         # Aggregate by week
         weekly = (
-            df.groupby(["iso_year", "iso_week"])
+            df.groupby("week_start")
             .agg(
                 pr_count=("closed_date", "count"),
-                cycle_time_p50=("cycle_time_minutes", lambda x: x.quantile(0.5)),
+                cycle_time_p50=("cycle_time_minutes", "median"),
             )
             .reset_index()
         )
 
-        # Calculate week start date (Monday) using dedicated utility
-        weekly["week_start"] = weekly.apply(
-            lambda row: align_to_monday(
-                date.fromisocalendar(int(row["iso_year"]), int(row["iso_week"]), 1)
-            ),
-            axis=1,
-        )
-
         # Rename for Prophet (ds = date, y = value)
         weekly["ds"] = pd.to_datetime(weekly["week_start"])
 
@@ -193,13 +197,7 @@ class ProphetForecaster:
         Returns:
             Forecast dict or None if failed.
         """
-        # Map metric to column
-        column_map = {
-            "pr_throughput": "pr_count",
-            "cycle_time_minutes": "cycle_time_p50",
-        }
-
-        column = column_map.get(metric)
+        column = _COLUMN_MAP.get(metric)
         if column not in df.columns:
             return None
 
@@ -280,8 +278,35 @@ class ProphetForecaster:
         }
 
         file_path = predictions_dir / "trends.json"
-        with file_path.open("w", encoding="utf-8") as f:
-            json.dump(predictions, f, indent=2, sort_keys=True)
+        if self._predictions_unchanged(file_path, predictions):
+            logger.info("predictions/trends.json unchanged - skipping rewrite")
+            return True
+        # Single write_text call; json.dump would stream small chunks
+        # through the text wrapper. sort_keys stays for determinism.
+        file_path.write_text(
+            json.dumps(predictions, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
 
         logger.info(f"Generated predictions/trends.json with {len(forecasts)} metrics")
         return True
+
+    @staticmethod
+    def _predictions_unchanged(
+        file_path: Path, predictions: dict[str, Any]
+    ) -> bool:
+        """Check whether an existing trends.json already holds this payload.
+
+        generated_at is a fresh timestamp every run, so the comparison
+        is done on the parsed documents minus that field. Any read or
+        parse problem counts as changed.
+        """
+        try:
+            existing = json.loads(file_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if not isinstance(existing, dict):
+            return False
+        return {k: v for k, v in existing.items() if k != "generated_at"} == {
+            k: v for k, v in predictions.items() if k != "generated_at"
+        }
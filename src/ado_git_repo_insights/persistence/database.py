@@ -52,27 +52,58 @@ class DatabaseManager:
             raise DatabaseError("Database not connected. Call connect() first.")
         return self._connection
 
-    def connect(self) -> None:
+    def connect(self, read_only: bool = False) -> None:
         """Open a connection to the database.
 
         Creates the database file and parent directories if they don't exist.
         Initializes the schema on first connection.
+
+        Args:
+            read_only: Open via SQLite's mode=ro URI. Read-only connections
+                take weaker locks (an extract can write concurrently) and
+                enforce PRAGMA query_only. The database must already exist;
+                schema initialization is skipped.
+
+        Raises:
+            DatabaseError: If read_only is requested for a missing database.
         """
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if not read_only:
+            # Ensure parent directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         is_new_db = not self.db_path.exists()
+        if read_only and is_new_db:
+            raise DatabaseError(
+                f"Cannot open missing database read-only: {self.db_path}"
+            )
 
         try:
-            self._connection = sqlite3.connect(
-                str(self.db_path),
-                isolation_level=None,  # Autocommit; we'll manage transactions explicitly
-            )
+            if read_only:
+                self._connection = sqlite3.connect(
+                    f"file:{self.db_path}?mode=ro",
+                    uri=True,
+                    isolation_level=None,
+                )
+            else:
+                self._connection = sqlite3.connect(
+                    str(self.db_path),
+                    isolation_level=None,  # Autocommit; we'll manage transactions explicitly
+                )
             self._connection.row_factory = sqlite3.Row
 
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
 
+            if read_only:
+                # Belt-and-braces: reject any write statement on this handle
+                self._connection.execute("PRAGMA query_only = ON")
+            else:
+                # WAL keeps readers unblocked during bulk writes; NORMAL skips
+                # the per-commit fsync that FULL pays, which is plenty durable
+                # for a rebuildable local extraction cache
+                self._connection.execute("PRAGMA journal_mode = WAL")
+                self._connection.execute("PRAGMA synchronous = NORMAL")
+
             if is_new_db:
                 logger.info(f"Creating new database at {self.db_path}")
                 self._initialize_schema()
@@ -87,6 +118,21 @@ class DatabaseManager:
             self.close()  # Ensure connection is closed on validation error
             raise
 
+    def __enter__(self) -> DatabaseManager:
+        """Connect (if needed) and return self.
+
+        Lets composed callers - scripts running several DB-touching steps
+        in one process - share a single connection and its PRAGMA setup
+        instead of paying the open handshake per step.
+        """
+        if self._connection is None:
+            self.connect()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection on scope exit."""
+        self.close()
+
     def close(self) -> None:
         """Close the database connection."""
         if self._connection is not None:
@@ -136,6 +182,13 @@ class DatabaseManager:
 
         Invariant 7: On failure, changes are rolled back.
 
+        This is the one sanctioned transaction idiom: the connection runs
+        in autocommit mode (isolation_level=None), so sqlite3's own
+        ``with connection:`` context manager would neither begin a
+        transaction nor roll anything back here. Explicit BEGIN/COMMIT
+        gives bulk writers a single journal commit instead of one per
+        statement.
+
         Yields:
             Database cursor for executing queries.
         """
@@ -81,6 +81,8 @@ CREATE INDEX IF NOT EXISTS idx_pull_requests_closed_date
     ON pull_requests(closed_date);
 CREATE INDEX IF NOT EXISTS idx_pull_requests_org_project
     ON pull_requests(organization_name, project_name);
+CREATE INDEX IF NOT EXISTS idx_pull_requests_user
+    ON pull_requests(user_id);
 
 -- reviewers.csv: pull_request_uid, user_id, vote, repository_id
 CREATE TABLE IF NOT EXISTS reviewers (
@@ -601,6 +601,70 @@ class PRRepository:
             ),
         )
 
+    def upsert_users_many(self, rows: list[tuple[Any, ...]]) -> None:
+        """Bulk insert or update users.
+
+        One executemany amortizes statement parse/plan across all rows;
+        callers should deduplicate on user_id first.
+
+        Args:
+            rows: Tuples of (user_id, display_name, email).
+        """
+        self.db.executemany(
+            """
+            INSERT OR REPLACE INTO users (user_id, display_name, email)
+            VALUES (?, ?, ?)
+            """,
+            rows,
+        )
+
+    def upsert_threads_many(self, rows: list[tuple[Any, ...]]) -> None:
+        """Bulk insert or update PR threads.
+
+        Args:
+            rows: Tuples matching the upsert_thread parameter order:
+                (thread_id, pull_request_uid, status, thread_context,
+                last_updated, created_at, is_deleted as 0/1).
+        """
+        self.db.executemany(
+            """
+            INSERT INTO pr_threads (
+                thread_id, pull_request_uid, status, thread_context,
+                last_updated, created_at, is_deleted
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(thread_id) DO UPDATE SET
+                status = excluded.status,
+                thread_context = excluded.thread_context,
+                last_updated = excluded.last_updated,
+                is_deleted = excluded.is_deleted
+            """,
+            rows,
+        )
+
+    def upsert_comments_many(self, rows: list[tuple[Any, ...]]) -> None:
+        """Bulk insert or update PR comments.
+
+        FK dependency: authors must be upserted before comments.
+
+        Args:
+            rows: Tuples matching the upsert_comment parameter order:
+                (comment_id, thread_id, pull_request_uid, author_id, content,
+                comment_type, created_at, last_updated, is_deleted as 0/1).
+        """
+        self.db.executemany(
+            """
+            INSERT INTO pr_comments (
+                comment_id, thread_id, pull_request_uid, author_id,
+                content, comment_type, created_at, last_updated, is_deleted
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(comment_id) DO UPDATE SET
+                content = excluded.content,
+                last_updated = excluded.last_updated,
+                is_deleted = excluded.is_deleted
+            """,
+            rows,
+        )
+
     def get_thread_last_updated(self, pull_request_uid: str) -> str | None:
         """Get the most recent thread update time for a PR.
 
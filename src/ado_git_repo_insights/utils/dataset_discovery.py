@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,25 @@ DEPRECATED_LAYOUT_ERROR = (
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_manifest(path_str: str, _mtime_ns: int) -> Any:
+    """Parse a manifest file, memoized per (path, mtime).
+
+    Discovery, root validation, and path validation all parse the same
+    dataset-manifest.json on a dashboard cold start; the cache collapses
+    those into one parse while a rewritten file (new mtime) gets a fresh
+    entry. Parse errors propagate - lru_cache does not cache exceptions,
+    so failures are simply retried.
+    """
+    with Path(path_str).open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_manifest(manifest_path: Path) -> Any:
+    """Load a manifest through the (path, mtime)-keyed parse cache."""
+    return _parse_manifest(str(manifest_path), manifest_path.stat().st_mtime_ns)
+
+
 def find_dataset_roots(run_artifacts_dir: Path) -> list[Path]:
     """Find valid dataset root directories containing dataset-manifest.json.
 
@@ -48,17 +69,19 @@ def find_dataset_roots(run_artifacts_dir: Path) -> list[Path]:
         candidate_path = run_artifacts_dir / candidate
         manifest_path = candidate_path / "dataset-manifest.json"
 
-        if manifest_path.exists():
-            # Validate it's a valid JSON file
-            try:
-                with manifest_path.open("r", encoding="utf-8") as f:
-                    json.load(f)
-                valid_roots.append(candidate_path.resolve())
-                logger.debug(f"Found valid dataset root: {candidate_path}")
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning(
-                    f"Found manifest at {manifest_path} but failed to parse: {e}"
-                )
+        # Open directly instead of stat-then-open: a missing manifest is
+        # the common case and surfaces as FileNotFoundError (an OSError),
+        # so the exists() probe was a redundant syscall per candidate
+        try:
+            _read_manifest(manifest_path)
+            valid_roots.append(candidate_path.resolve())
+            logger.debug(f"Found valid dataset root: {candidate_path}")
+        except FileNotFoundError:
+            continue
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(
+                f"Found manifest at {manifest_path} but failed to parse: {e}"
+            )
 
     return valid_roots
 
@@ -95,8 +118,7 @@ def validate_dataset_root(dataset_path: Path) -> tuple[bool, str | None]:
         return False, f"dataset-manifest.json not found in {dataset_path}"
 
     try:
-        with manifest_path.open("r", encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = _read_manifest(manifest_path)
 
         # Check for required manifest fields
         if "manifest_schema_version" not in manifest:
@@ -152,8 +174,7 @@ def validate_manifest_paths(dataset_root: Path) -> tuple[bool, list[str]]:
         return False, ["dataset-manifest.json not found"]
 
     try:
-        with manifest_path.open("r", encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = _read_manifest(manifest_path)
     except (json.JSONDecodeError, OSError) as e:
         return False, [f"Failed to read manifest: {e}"]
 
@@ -6,6 +6,7 @@ Captures comprehensive run telemetry including per-project status and first fata
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
@@ -144,20 +145,33 @@ class RunSummary:
                 print(f"##vso[task.logissue type=warning]{warning}")
 
 
+@functools.lru_cache(maxsize=1)
 def get_tool_version() -> str:
-    """Get tool version from VERSION file."""
+    """Get tool version from VERSION file.
+
+    Cached for the process lifetime - the version cannot change mid-run.
+    """
     version_file = Path(__file__).parent.parent.parent.parent / "VERSION"
     if version_file.exists():
         return version_file.read_text().strip()
     return "unknown"
 
 
+@functools.lru_cache(maxsize=1)
 def get_git_sha() -> str | None:
-    """Get Git SHA from VERSION file or git command.
+    """Get Git SHA from CI environment, VERSION file, or git command.
+
+    Cached for the process lifetime so the git subprocess runs at most
+    once even though both success and failure paths request the SHA.
 
     Returns:
         Git SHA or None if unavailable.
     """
+    # CI exposes the SHA directly - no subprocess needed there
+    env_sha = os.environ.get("BUILD_SOURCEVERSION") or os.environ.get("GITHUB_SHA")
+    if env_sha:
+        return env_sha[:7]  # Match git rev-parse --short output
+
     # Try VERSION file first
     version_file = Path(__file__).parent.parent.parent.parent / "VERSION"
     if version_file.exists():
@@ -11,19 +11,28 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import re
 import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Iterator
 
 logger = logging.getLogger(__name__)
 
 # Only sync these file types - ignore everything else
 ALLOWED_EXTENSIONS = {".js", ".css", ".html"}
 
+# Compiled once at import: a single anchored match per filename replaces
+# splitext + lower + set lookup in the directory-walk hot loop
+_ALLOWED_FILE_RE = re.compile(
+    "(?:" + "|".join(re.escape(ext) for ext in sorted(ALLOWED_EXTENSIONS)) + ")$",
+    re.IGNORECASE,
+)
+
 # Required entrypoints that must exist for a valid dist
 REQUIRED_ENTRYPOINTS = {"index.html", "dashboard.js"}
 
@@ -57,6 +66,36 @@ def is_dev_mode() -> tuple[bool, Path | None]:
     return False, None
 
 
+def _iter_ui_files(directory: Path) -> Iterator[tuple[str, str]]:
+    """Yield (absolute_path, relative_path) for allowed files under directory.
+
+    Walks with os.scandir so file-type checks come from the cached dirent
+    (one syscall per directory) instead of the extra stat per entry that
+    rglob + is_file() incurs, and computes relative paths by string slicing
+    rather than Path.relative_to.
+    """
+    root = str(directory)
+    prefix_len = len(root) + 1
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file() and _ALLOWED_FILE_RE.search(entry.name):
+                    yield entry.path, entry.path[prefix_len:]
+
+
+def _hash_file(path: str | Path) -> str:
+    """SHA256 a file in fixed-size chunks so large assets stay out of memory."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def compute_manifest(directory: Path) -> dict[str, str]:
     """Build content manifest: {relative_path: sha256_hash}.
 
@@ -67,16 +106,8 @@ def compute_manifest(directory: Path) -> dict[str, str]:
     if not directory.exists():
         return manifest
 
-    for file_path in directory.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if file_path.suffix.lower() not in ALLOWED_EXTENSIONS:
-            continue
-
-        rel_path = file_path.relative_to(directory)
-        content = file_path.read_bytes()
-        file_hash = hashlib.sha256(content).hexdigest()
-        manifest[str(rel_path)] = file_hash
+    for abs_path, rel_path in _iter_ui_files(directory):
+        manifest[rel_path] = _hash_file(abs_path)
 
     return manifest
 
@@ -85,10 +116,30 @@ def sync_needed(source: Path, target: Path) -> bool:
     """Check if sync is needed based on content hashes.
 
     Returns True if source and target have different content.
+
+    Compares the file sets first (no hashing) and then hashes pairwise,
+    returning at the first difference - a stale bundle is detected without
+    hashing the remainder of either tree.
     """
-    source_manifest = compute_manifest(source)
-    target_manifest = compute_manifest(target)
-    return source_manifest != target_manifest
+    source_files = dict(_iter_ui_files(source)) if source.exists() else {}
+    target_files = dict(_iter_ui_files(target)) if target.exists() else {}
+
+    # Keyed by relative path: {rel_path: abs_path}
+    source_by_rel = {rel: abs_path for abs_path, rel in source_files.items()}
+    target_by_rel = {rel: abs_path for abs_path, rel in target_files.items()}
+
+    if source_by_rel.keys() != target_by_rel.keys():
+        return True
+
+    # Size mismatch proves a difference without reading either file, so
+    # check every pair with two stats before hashing anything
+    pairs = [(source_by_rel[rel], target_by_rel[rel]) for rel in source_by_rel]
+    if any(
+        os.stat(src).st_size != os.stat(dst).st_size for src, dst in pairs
+    ):
+        return True
+
+    return any(_hash_file(src) != _hash_file(dst) for src, dst in pairs)
 
 
 def validate_dist(dist_path: Path) -> None:
@@ -111,29 +162,47 @@ def validate_dist(dist_path: Path) -> None:
             )
 
 
-def _copy_with_hash(source: Path, temp: Path) -> dict[str, str]:
+def _copy_with_hash(
+    source: Path,
+    temp: Path,
+    target: Path | None = None,
+    target_manifest: dict[str, str] | None = None,
+) -> dict[str, str]:
     """Copy allowed files from source to temp, computing hashes inline.
 
+    When the current target manifest is supplied, files whose content is
+    unchanged are hard-linked from the existing target instead of being
+    rewritten - incremental syncs (the common case) write no data for
+    untouched assets. Falls back to a plain write where links are
+    unsupported.
+
     Returns manifest of copied files.
     """
     manifest: dict[str, str] = {}
 
-    for src_file in source.rglob("*"):
-        if not src_file.is_file():
-            continue
-        if src_file.suffix.lower() not in ALLOWED_EXTENSIONS:
-            continue
-
-        rel_path = src_file.relative_to(source)
+    for abs_path, rel_path in _iter_ui_files(source):
         dst_file = temp / rel_path
 
         # Create parent directories
         dst_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Read, hash, and write in one pass
-        content = src_file.read_bytes()
-        dst_file.write_bytes(content)
-        manifest[str(rel_path)] = hashlib.sha256(content).hexdigest()
+        file_hash = _hash_file(abs_path)
+        manifest[rel_path] = file_hash
+
+        if (
+            target is not None
+            and target_manifest is not None
+            and target_manifest.get(rel_path) == file_hash
+        ):
+            try:
+                os.link(target / rel_path, dst_file)
+                continue
+            except OSError:
+                pass  # Cross-device or unsupported filesystem - copy instead
+
+        # copyfile uses the kernel fast-copy paths (sendfile/copy_file_range)
+        # where available, so file bytes never round-trip through userspace
+        shutil.copyfile(abs_path, dst_file)
 
     return manifest
 
@@ -214,9 +283,12 @@ def sync_ui_bundle(source: Path, target: Path) -> dict[str, str]:
     # Create temp directory next to target for atomic rename
     temp = target.parent / f"{target.name}.tmp.{uuid4().hex[:8]}"
 
+    # Existing target content lets unchanged files be linked, not rewritten
+    target_manifest = compute_manifest(target)
+
     try:
         # Copy with inline hashing
-        manifest = _copy_with_hash(source, temp)
+        manifest = _copy_with_hash(source, temp, target, target_manifest)
 
         if not manifest:
             raise SyncError(
@@ -113,6 +113,68 @@ class TestDatabaseOpenFailure:
             assert db_path.exists()
             manager.close()
 
+    def test_context_manager_connects_and_closes(self) -> None:
+        """The manager works as a context manager for composed callers."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+
+            with DatabaseManager(db_path) as manager:
+                assert manager.connection is not None
+
+            # Connection is closed on scope exit
+            with pytest.raises(DatabaseError, match="not connected"):
+                _ = manager.connection
+
+    def test_context_manager_reuses_open_connection(self) -> None:
+        """Entering an already-connected manager does not reconnect."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+
+            manager = DatabaseManager(db_path)
+            manager.connect()
+            conn = manager.connection
+
+            with manager as entered:
+                assert entered is manager
+                assert entered.connection is conn
+
+    def test_read_only_connect_rejects_writes(self) -> None:
+        """A read-only connection serves reads but refuses writes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "db.sqlite"
+
+            # Create and populate via a normal connection first
+            writer = DatabaseManager(db_path)
+            writer.connect()
+            writer.close()
+
+            reader = DatabaseManager(db_path)
+            reader.connect(read_only=True)
+
+            # Reads work
+            cursor = reader.execute("SELECT COUNT(*) as n FROM pull_requests")
+            assert cursor.fetchone()["n"] == 0
+
+            # Writes are rejected
+            with pytest.raises(sqlite3.Error):
+                reader.execute(
+                    "INSERT INTO organizations (organization_name) VALUES ('x')"
+                )
+
+            reader.close()
+
+    def test_read_only_missing_database_fails(self) -> None:
+        """Read-only mode never creates the database file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "absent.sqlite"
+
+            manager = DatabaseManager(db_path)
+
+            with pytest.raises(DatabaseError, match="read-only"):
+                manager.connect(read_only=True)
+
+            assert not db_path.exists()
+
     def test_connection_error_provides_useful_message(self) -> None:
         """Connection errors include useful information for debugging."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -19,20 +19,111 @@ from pathlib import Path
 from types import ModuleType
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from jsonschema import Draft202012Validator
 
 from ado_git_repo_insights.persistence.database import DatabaseManager
 from ado_git_repo_insights.transform.aggregators import AggregateGenerator
 
+
+def _load_json(path: Path) -> dict:
+    """Read and parse a JSON artifact in one call.
+
+    Shared by the trends/summary/manifest assertions below; reads the
+    whole file at once instead of streaming through a file handle.
+    """
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+# Structural contracts, compiled once at module scope and reused by the
+# loader-compatibility and insights-contract tests below
+TRENDS_SCHEMA = {
+    "type": "object",
+    "required": ["schema_version", "generated_at", "is_stub", "forecasts"],
+    "properties": {
+        "forecasts": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["metric", "unit", "values"],
+                "properties": {
+                    "values": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": [
+                                "period_start",
+                                "predicted",
+                                "lower_bound",
+                                "upper_bound",
+                            ],
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+TRENDS_VALIDATOR = Draft202012Validator(TRENDS_SCHEMA)
+
+INSIGHTS_SCHEMA = {
+    "type": "object",
+    "required": ["insights"],
+    "properties": {
+        "insights": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": [
+                    "category",
+                    "severity",
+                    "title",
+                    "description",
+                    "affected_entities",
+                ],
+                "properties": {
+                    "category": {"enum": ["bottleneck", "trend", "anomaly"]},
+                    "severity": {"enum": ["info", "warning", "critical"]},
+                    "affected_entities": {"type": "array"},
+                },
+            },
+        },
+    },
+}
+INSIGHTS_VALIDATOR = Draft202012Validator(INSIGHTS_SCHEMA)
+
+# Canned OpenAI completion payload, serialized once at module scope; the
+# mock client fixture and the contract test share it
+_MOCK_INSIGHTS = {
+    "insights": [
+        {
+            "category": "trend",
+            "severity": "info",
+            "title": "Stable PR throughput",
+            "description": "PR volume has remained consistent over the analysis period.",
+            "affected_entities": ["project:test-project"],
+        },
+        {
+            "category": "bottleneck",
+            "severity": "warning",
+            "title": "Review latency detected",
+            "description": "Some PRs show extended cycle times indicating review delays.",
+            "affected_entities": ["repo:test-repo"],
+        },
+    ]
+}
+_MOCK_INSIGHTS_JSON = json.dumps(_MOCK_INSIGHTS)
+
+
 # ============================================================================
 # Mock Module Fixtures
 # ============================================================================
 
 
-@pytest.fixture
-def mock_prophet_class() -> MagicMock:
-    """Mock Prophet class with deterministic predictions."""
+def _build_prophet_mock() -> MagicMock:
+    """Build a mock Prophet class with deterministic predictions."""
     mock_model_instance = MagicMock()
 
     # Mock forecast result - 4 weeks of predictions
@@ -54,6 +145,12 @@ def mock_prophet_class() -> MagicMock:
     return mock_class
 
 
+@pytest.fixture
+def mock_prophet_class() -> MagicMock:
+    """Mock Prophet class with deterministic predictions."""
+    return _build_prophet_mock()
+
+
 @pytest.fixture
 def fake_prophet_module(mock_prophet_class: MagicMock) -> ModuleType:
     """Create a fake prophet module with mock Prophet class."""
@@ -69,26 +166,7 @@ def mock_openai_client() -> MagicMock:
 
     # Create mock response structure
     mock_message = MagicMock()
-    mock_message.content = json.dumps(
-        {
-            "insights": [
-                {
-                    "category": "trend",
-                    "severity": "info",
-                    "title": "Stable PR throughput",
-                    "description": "PR volume has remained consistent over the analysis period.",
-                    "affected_entities": ["project:test-project"],
-                },
-                {
-                    "category": "bottleneck",
-                    "severity": "warning",
-                    "title": "Review latency detected",
-                    "description": "Some PRs show extended cycle times indicating review delays.",
-                    "affected_entities": ["repo:test-repo"],
-                },
-            ]
-        }
-    )
+    mock_message.content = _MOCK_INSIGHTS_JSON
 
     mock_choice = MagicMock()
     mock_choice.message = mock_message
@@ -127,12 +205,8 @@ def temp_db(tmp_path: Path) -> DatabaseManager:
     db.close()  # Properly close connection to avoid ResourceWarning
 
 
-@pytest.fixture
-def temp_db_with_prs(temp_db: DatabaseManager) -> DatabaseManager:
-    """Database with sample PR data spanning 4+ weeks.
-
-    Note: This fixture depends on temp_db which handles cleanup via yield.
-    """
+def _seed_sample_prs(temp_db: DatabaseManager) -> None:
+    """Seed a connected database with sample PR data spanning 4+ weeks."""
     # Insert entities in order respecting foreign keys
     temp_db.execute(
         "INSERT INTO organizations (organization_name) VALUES (?)", ("test-org",)
@@ -167,36 +241,74 @@ def temp_db_with_prs(temp_db: DatabaseManager) -> DatabaseManager:
         ("pr-10", 10, base_date + timedelta(days=22), 170.0),
     ]
 
-    for uid, pr_id, closed, cycle_time in prs:
-        closed_str = closed.isoformat() + "T12:00:00Z"
-        created_str = (
-            closed - timedelta(minutes=int(cycle_time))
-        ).isoformat() + "T12:00:00Z"
-        temp_db.execute(
+    # Batch the PR rows: executemany prepares the statement once, and the
+    # explicit transaction commits once instead of per autocommitted row
+    rows = [
+        (
+            uid,
+            pr_id,
+            "test-org",
+            "test-project",
+            "repo-1",
+            "user-1",
+            f"Test PR {pr_id}",
+            "completed",
+            "Test description",
+            (closed - timedelta(minutes=int(cycle_time))).isoformat() + "T12:00:00Z",
+            closed.isoformat() + "T12:00:00Z",
+            cycle_time,
+        )
+        for uid, pr_id, closed, cycle_time in prs
+    ]
+    with temp_db.transaction() as cursor:
+        cursor.executemany(
             """INSERT INTO pull_requests
                (pull_request_uid, pull_request_id, organization_name, project_name,
                 repository_id, user_id, title, status, description,
                 creation_date, closed_date, cycle_time_minutes)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                uid,
-                pr_id,
-                "test-org",
-                "test-project",
-                "repo-1",
-                "user-1",
-                f"Test PR {pr_id}",
-                "completed",
-                "Test description",
-                created_str,
-                closed_str,
-                cycle_time,
-            ),
+            rows,
         )
 
-    temp_db.connection.commit()
-    # No need for cleanup here - temp_db fixture handles it
-    return temp_db
+
+@pytest.fixture(scope="module")
+def temp_db_with_prs(tmp_path_factory: pytest.TempPathFactory) -> DatabaseManager:
+    """Database with sample PR data spanning 4+ weeks.
+
+    Module-scoped: every consumer treats the seeded data as read-only,
+    so one database serves the whole module instead of being rebuilt per
+    test. Tests needing an empty or writable database take temp_db.
+    """
+    db_path = tmp_path_factory.mktemp("shared_db") / "test.db"
+    db = DatabaseManager(db_path)
+    db.connect()  # connect() auto-creates schema for new databases
+    _seed_sample_prs(db)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def forecaster_trends(
+    temp_db_with_prs: DatabaseManager, tmp_path_factory: pytest.TempPathFactory
+) -> dict:
+    """Parsed trends.json from a single shared ProphetForecaster run.
+
+    The schema-assertion tests below only read the generated output, so
+    the forecaster runs once per module instead of once per test.
+    """
+    from ado_git_repo_insights.ml.forecaster import ProphetForecaster
+
+    fake_module = ModuleType("prophet")
+    fake_module.Prophet = _build_prophet_mock()  # type: ignore[attr-defined]
+
+    output_dir = tmp_path_factory.mktemp("forecaster_out")
+    with patch.dict(sys.modules, {"prophet": fake_module}):
+        forecaster = ProphetForecaster(db=temp_db_with_prs, output_dir=output_dir)
+        assert forecaster.generate() is True
+
+    trends_path = output_dir / "predictions" / "trends.json"
+    assert trends_path.exists(), "trends.json should be created"
+    return _load_json(trends_path)
 
 
 # ============================================================================
@@ -207,31 +319,9 @@ def temp_db_with_prs(temp_db: DatabaseManager) -> DatabaseManager:
 class TestProphetForecasterIntegration:
     """Integration tests for ProphetForecaster using mocked Prophet."""
 
-    def test_forecaster_generates_valid_trends_json(
-        self,
-        temp_db_with_prs: DatabaseManager,
-        fake_prophet_module: ModuleType,
-        tmp_path: Path,
-    ):
+    def test_forecaster_generates_valid_trends_json(self, forecaster_trends: dict):
         """Forecaster should generate valid trends.json with real DB data."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=temp_db_with_prs, output_dir=output_dir)
-            result = forecaster.generate()
-
-        assert result is True
-
-        # trends.json should exist
-        trends_path = output_dir / "predictions" / "trends.json"
-        assert trends_path.exists(), "trends.json should be created"
-
-        # Should be valid JSON with required schema
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = forecaster_trends
 
         assert trends["schema_version"] == 1
         assert "generated_at" in trends
@@ -239,82 +329,59 @@ class TestProphetForecasterIntegration:
         assert "forecasts" in trends
         assert isinstance(trends["forecasts"], list)
 
-    def test_forecaster_monday_alignment(
-        self,
-        temp_db_with_prs: DatabaseManager,
-        fake_prophet_module: ModuleType,
-        tmp_path: Path,
-    ):
+    def test_forecaster_monday_alignment(self, forecaster_trends: dict):
         """All forecast period_start dates should be Monday-aligned."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=temp_db_with_prs, output_dir=output_dir)
-            forecaster.generate()
-
-        trends_path = output_dir / "predictions" / "trends.json"
-        with open(trends_path) as f:
-            trends = json.load(f)
-
-        for forecast in trends["forecasts"]:
-            for value in forecast["values"]:
-                period_date = date.fromisoformat(value["period_start"])
-                assert period_date.weekday() == 0, (
-                    f"period_start {value['period_start']} should be Monday"
-                )
+        all_dates = [
+            value["period_start"]
+            for forecast in forecaster_trends["forecasts"]
+            for value in forecast["values"]
+        ]
+        arr = np.array(all_dates, dtype="datetime64[D]")
+        # The datetime64 epoch (1970-01-01) is a Thursday, so a Monday
+        # satisfies (days_since_epoch - 4) % 7 == 0
+        not_monday = (arr.astype("int64") - 4) % 7 != 0
+        assert not not_monday.any(), (
+            f"period_start dates should be Monday: {arr[not_monday]}"
+        )
 
-    def test_forecaster_bounds_are_valid(
-        self,
-        temp_db_with_prs: DatabaseManager,
-        fake_prophet_module: ModuleType,
-        tmp_path: Path,
-    ):
+    def test_forecaster_bounds_are_valid(self, forecaster_trends: dict):
         """Forecast bounds should be valid (lower <= predicted <= upper, lower >= 0)."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=temp_db_with_prs, output_dir=output_dir)
-            forecaster.generate()
-
-        trends_path = output_dir / "predictions" / "trends.json"
-        with open(trends_path) as f:
-            trends = json.load(f)
-
-        for forecast in trends["forecasts"]:
-            for value in forecast["values"]:
-                assert value["lower_bound"] >= 0, "lower_bound should be non-negative"
-                assert value["lower_bound"] <= value["predicted"], (
-                    "lower_bound <= predicted"
-                )
-                assert value["predicted"] <= value["upper_bound"], (
-                    "predicted <= upper_bound"
-                )
-
-    def test_forecaster_empty_database(self, temp_db: DatabaseManager, tmp_path: Path):
+        values = [
+            value
+            for forecast in forecaster_trends["forecasts"]
+            for value in forecast["values"]
+        ]
+        lower = np.array([v["lower_bound"] for v in values], dtype=np.float64)
+        predicted = np.array([v["predicted"] for v in values], dtype=np.float64)
+        upper = np.array([v["upper_bound"] for v in values], dtype=np.float64)
+
+        assert np.all(lower >= 0), "lower_bound should be non-negative"
+        assert np.all(lower <= predicted), "lower_bound <= predicted"
+        assert np.all(predicted <= upper), "predicted <= upper_bound"
+
+    def test_forecaster_empty_database(self, tmp_path: Path):
         """Forecaster with empty DB should write empty forecasts array."""
         from ado_git_repo_insights.ml.forecaster import ProphetForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
-        # Empty DB - no data to forecast
-        with patch("pandas.read_sql_query", return_value=pd.DataFrame()):
-            forecaster = ProphetForecaster(db=temp_db, output_dir=output_dir)
+        # In-memory sqlite with schema but no rows: the real query runs
+        # against empty tables, and no fake prophet module is injected,
+        # proving the empty-data branch returns before the import
+        db = DatabaseManager(Path(":memory:"))
+        db.connect()
+        try:
+            forecaster = ProphetForecaster(db=db, output_dir=output_dir)
             result = forecaster.generate()
+        finally:
+            db.close()
 
         assert result is True
 
         trends_path = output_dir / "predictions" / "trends.json"
         assert trends_path.exists()
 
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = _load_json(trends_path)
         assert trends["forecasts"] == []
 
     def test_forecaster_without_prophet_returns_false(
@@ -324,7 +391,6 @@ class TestProphetForecasterIntegration:
         from ado_git_repo_insights.ml.forecaster import ProphetForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         # Mock data that would trigger Prophet import
         df_data = {
@@ -359,7 +425,6 @@ class TestFallbackForecasterIntegration:
         from ado_git_repo_insights.ml.fallback_forecaster import FallbackForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         forecaster = FallbackForecaster(db=temp_db_with_prs, output_dir=output_dir)
         result = forecaster.generate()
@@ -371,8 +436,7 @@ class TestFallbackForecasterIntegration:
         assert trends_path.exists(), "trends.json should be created"
 
         # Should be valid JSON with required schema
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = _load_json(trends_path)
 
         assert trends["schema_version"] == 1
         assert "generated_at" in trends
@@ -391,14 +455,12 @@ class TestFallbackForecasterIntegration:
         from ado_git_repo_insights.ml.fallback_forecaster import FallbackForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         forecaster = FallbackForecaster(db=temp_db_with_prs, output_dir=output_dir)
         forecaster.generate()
 
         trends_path = output_dir / "predictions" / "trends.json"
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = _load_json(trends_path)
 
         for forecast in trends["forecasts"]:
             for value in forecast["values"]:
@@ -416,14 +478,12 @@ class TestFallbackForecasterIntegration:
         from ado_git_repo_insights.ml.fallback_forecaster import FallbackForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         forecaster = FallbackForecaster(db=temp_db_with_prs, output_dir=output_dir)
         forecaster.generate()
 
         trends_path = output_dir / "predictions" / "trends.json"
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = _load_json(trends_path)
 
         for forecast in trends["forecasts"]:
             for value in forecast["values"]:
@@ -442,7 +502,6 @@ class TestFallbackForecasterIntegration:
         from ado_git_repo_insights.ml.fallback_forecaster import FallbackForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         forecaster = FallbackForecaster(db=temp_db, output_dir=output_dir)
         result = forecaster.generate()
@@ -452,8 +511,7 @@ class TestFallbackForecasterIntegration:
         trends_path = output_dir / "predictions" / "trends.json"
         assert trends_path.exists()
 
-        with open(trends_path) as f:
-            trends = json.load(f)
+        trends = _load_json(trends_path)
 
         assert trends["forecasts"] == []
         assert trends["data_quality"] == "insufficient"
@@ -467,7 +525,6 @@ class TestFallbackForecasterIntegration:
         from ado_git_repo_insights.ml.fallback_forecaster import FallbackForecaster
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         forecaster = FallbackForecaster(db=temp_db_with_prs, output_dir=output_dir)
         forecaster.generate()
@@ -546,17 +603,15 @@ def mock_insights_db() -> MagicMock:
 
     def mock_execute(query: str, *args) -> MagicMock:
         cursor = MagicMock()
-        if "COUNT(*)" in query and "completed" in query:
-            cursor.fetchone.return_value = {"cnt": 10}
-        elif "MIN(closed_date)" in query:
+        if "MIN(closed_date)" in query:
+            # Combined pull_requests aggregate row
             cursor.fetchone.return_value = {
+                "completed_prs": 10,
                 "min_date": "2026-01-01T00:00:00Z",
                 "max_date": "2026-01-15T00:00:00Z",
+                "avg_cycle": 145.0,
+                "authors": 1,
             }
-        elif "AVG(cycle_time_minutes)" in query:
-            cursor.fetchone.return_value = {"avg_cycle": 145.0, "max_cycle": 200.0}
-        elif "COUNT(DISTINCT user_id)" in query:
-            cursor.fetchone.return_value = {"cnt": 1}
         elif "COUNT(*)" in query and "repositories" in query:
             cursor.fetchone.return_value = {"cnt": 1}
         elif "MAX(closed_date)" in query:
@@ -583,7 +638,6 @@ class TestLLMInsightsGeneratorIntegration:
 
         with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
             output_dir = tmp_path / "output"
-            output_dir.mkdir()
 
             generator = LLMInsightsGenerator(
                 db=mock_insights_db,
@@ -599,8 +653,7 @@ class TestLLMInsightsGeneratorIntegration:
         prompt_path = output_dir / "insights" / "prompt.json"
         assert prompt_path.exists(), "prompt.json should be created in dry-run"
 
-        with open(prompt_path) as f:
-            prompt_data = json.load(f)
+        prompt_data = _load_json(prompt_path)
 
         assert "prompt" in prompt_data
         assert "model" in prompt_data
@@ -615,7 +668,6 @@ class TestLLMInsightsGeneratorIntegration:
         from ado_git_repo_insights.ml.insights import LLMInsightsGenerator
 
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
         with (
             patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
@@ -632,8 +684,7 @@ class TestLLMInsightsGeneratorIntegration:
         summary_path = output_dir / "insights" / "summary.json"
         assert summary_path.exists()
 
-        with open(summary_path) as f:
-            summary = json.load(f)
+        summary = _load_json(summary_path)
 
         assert summary["schema_version"] == 1
         assert "generated_at" in summary
@@ -642,31 +693,30 @@ class TestLLMInsightsGeneratorIntegration:
         assert len(summary["insights"]) == 2
 
     def test_insights_without_api_key_fails(
-        self, mock_insights_db: MagicMock, tmp_path: Path
+        self,
+        mock_insights_db: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Insights generator should fail gracefully without API key."""
         from ado_git_repo_insights.ml.insights import LLMInsightsGenerator
 
-        # Remove OPENAI_API_KEY from environment
-        env_without_key = {
-            k: v for k, v in __import__("os").environ.items() if k != "OPENAI_API_KEY"
-        }
+        # Only this one variable matters; monkeypatch restores it on teardown
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
-        with patch.dict("os.environ", env_without_key, clear=True):
-            output_dir = tmp_path / "output"
-            output_dir.mkdir()
+        output_dir = tmp_path / "output"
 
-            generator = LLMInsightsGenerator(
-                db=mock_insights_db,
-                output_dir=output_dir,
-            )
+        generator = LLMInsightsGenerator(
+            db=mock_insights_db,
+            output_dir=output_dir,
+        )
 
-            # Should either raise or return False
-            try:
-                result = generator.generate()
-                assert result is False, "Should fail without API key"
-            except (ValueError, KeyError):
-                pass  # Expected exception is acceptable
+        # Should either raise or return False
+        try:
+            result = generator.generate()
+            assert result is False, "Should fail without API key"
+        except (ValueError, KeyError):
+            pass  # Expected exception is acceptable
 
 
 class TestInsightsContractCompliance:
@@ -674,38 +724,11 @@ class TestInsightsContractCompliance:
 
     def test_insights_schema_validation(self):
         """Verify insights comply with expected schema."""
-        mock_insights = {
-            "insights": [
-                {
-                    "category": "trend",
-                    "severity": "info",
-                    "title": "Stable PR throughput",
-                    "description": "PR volume has remained consistent.",
-                    "affected_entities": ["project:test-project"],
-                },
-                {
-                    "category": "bottleneck",
-                    "severity": "warning",
-                    "title": "Review latency detected",
-                    "description": "Some PRs show extended cycle times.",
-                    "affected_entities": ["repo:test-repo"],
-                },
-            ]
-        }
-
-        valid_categories = {"bottleneck", "trend", "anomaly"}
-        valid_severities = {"info", "warning", "critical"}
-
-        for insight in mock_insights["insights"]:
-            assert "category" in insight
-            assert "severity" in insight
-            assert "title" in insight
-            assert "description" in insight
-            assert "affected_entities" in insight
-
-            assert insight["category"] in valid_categories
-            assert insight["severity"] in valid_severities
-            assert isinstance(insight["affected_entities"], list)
+        errors = sorted(
+            INSIGHTS_VALIDATOR.iter_errors(_MOCK_INSIGHTS),
+            key=lambda e: e.json_path,
+        )
+        assert not errors, errors[0].message
 
 
 # ============================================================================
@@ -736,8 +759,7 @@ class TestAggregateGeneratorMLIntegration:
         manifest_path = output_dir / "dataset-manifest.json"
         assert manifest_path.exists()
 
-        with open(manifest_path) as f:
-            manifest_data = json.load(f)
+        manifest_data = _load_json(manifest_path)
 
         assert manifest_data["features"]["predictions"] is False
         assert manifest_data["features"]["ai_insights"] is False
@@ -763,8 +785,7 @@ class TestAggregateGeneratorMLIntegration:
         assert manifest.features.get("predictions") is True
 
         manifest_path = output_dir / "dataset-manifest.json"
-        with open(manifest_path) as f:
-            manifest_data = json.load(f)
+        manifest_data = _load_json(manifest_path)
 
         assert manifest_data["features"]["predictions"] is True
 
@@ -778,42 +799,15 @@ class TestDashboardLoaderCompatibility:
     """Tests to verify generated files are compatible with dashboard loader."""
 
     def test_predictions_file_matches_loader_expectations(
-        self,
-        temp_db_with_prs: DatabaseManager,
-        fake_prophet_module: ModuleType,
-        tmp_path: Path,
+        self, forecaster_trends: dict
     ):
         """Generated trends.json should match what dataset-loader.js expects."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=temp_db_with_prs, output_dir=output_dir)
-            forecaster.generate()
-
-        trends_path = output_dir / "predictions" / "trends.json"
-        with open(trends_path) as f:
-            trends = json.load(f)
-
-        # Loader expects these exact field names
-        assert "schema_version" in trends
-        assert "generated_at" in trends
-        assert "is_stub" in trends
-        assert "forecasts" in trends
-
-        # Each forecast must have these fields
-        for forecast in trends["forecasts"]:
-            assert "metric" in forecast
-            assert "unit" in forecast
-            assert "values" in forecast
-
-            for value in forecast["values"]:
-                assert "period_start" in value
-                assert "predicted" in value
-                assert "lower_bound" in value
-                assert "upper_bound" in value
+        # TRENDS_SCHEMA mirrors the exact field names dataset-loader.js reads
+        errors = sorted(
+            TRENDS_VALIDATOR.iter_errors(forecaster_trends),
+            key=lambda e: e.json_path,
+        )
+        assert not errors, errors[0].message
 
     def test_predictions_schema_structure(self):
         """Verify the expected structure of predictions schema."""
@@ -872,21 +866,16 @@ class TestDashboardLoaderCompatibility:
 class TestCLIMLFlags:
     """Tests for CLI --enable-predictions and --enable-insights flags."""
 
-    def test_cli_help_shows_ml_flags(self):
+    def test_cli_help_shows_ml_flags(self, capsys: pytest.CaptureFixture[str]):
         """CLI help should document ML flags."""
-        import subprocess
-
-        result = subprocess.run(  # noqa: S603 - trusted test input
-            [
-                sys.executable,
-                "-m",
-                "ado_git_repo_insights.cli",
-                "generate-aggregates",
-                "--help",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        from ado_git_repo_insights.cli import create_parser
+
+        # In-process instead of a subprocess probe: --help exits via
+        # SystemExit after printing the subcommand help to stdout
+        parser = create_parser("generate-aggregates")
+        with pytest.raises(SystemExit):
+            parser.parse_args(["generate-aggregates", "--help"])
 
-        assert "--enable-predictions" in result.stdout
-        assert "--enable-insights" in result.stdout
+        help_text = capsys.readouterr().out
+        assert "--enable-predictions" in help_text
+        assert "--enable-insights" in help_text
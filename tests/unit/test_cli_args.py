@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from ado_git_repo_insights.cli import create_parser
+from ado_git_repo_insights.cli import _detect_command, create_parser
 
 
 class TestArgumentParsing:
@@ -97,3 +97,35 @@ class TestArgumentParsing:
         parser = create_parser()
         args = parser.parse_args(["dashboard", "--dataset", "./dataset", "--open"])
         assert args.open is True
+
+
+class TestLazySubparserConstruction:
+    """Tests for the single-subparser startup path."""
+
+    def test_detect_command_finds_first_positional(self) -> None:
+        assert _detect_command(["extract", "--pat", "x"]) == "extract"
+
+    def test_detect_command_skips_global_value_options(self) -> None:
+        argv = ["--log-format", "jsonl", "--artifacts-dir", "out", "dashboard"]
+        assert _detect_command(argv) == "dashboard"
+
+    def test_detect_command_skips_abbreviated_global_options(self) -> None:
+        """Argparse prefix abbreviations of global options also take a value."""
+        assert _detect_command(["--log-form", "console", "extract"]) == "extract"
+        assert _detect_command(["--artifacts", "out", "dashboard"]) == "dashboard"
+        # '=' attaches the value, so the next token is the command
+        assert _detect_command(["--log-form=console", "extract"]) == "extract"
+
+    def test_detect_command_returns_none_without_command(self) -> None:
+        assert _detect_command([]) is None
+        assert _detect_command(["--help"]) is None
+
+    def test_detect_command_returns_none_for_unknown_command(self) -> None:
+        assert _detect_command(["not-a-command"]) is None
+
+    def test_single_command_parser_still_parses(self) -> None:
+        """A parser built for one command handles that command's args."""
+        parser = create_parser("extract")
+        args = parser.parse_args(["extract", "--pat", "test-pat"])
+        assert args.command == "extract"
+        assert args.pat == "test-pat"
@@ -159,7 +159,7 @@ class TestExtractComments:
         self, db: DatabaseManager, mock_client: MagicMock, mock_config: MagicMock
     ) -> None:
         """Test that max_prs limit is respected and capped flag is set."""
-        mock_client.get_pr_threads.return_value = []
+        mock_client.iter_pr_threads.return_value = []
 
         stats = _extract_comments(
             client=mock_client,
@@ -177,7 +177,7 @@ class TestExtractComments:
     ) -> None:
         """Test that max_threads_per_pr limit is applied."""
         # Return 10 threads but limit to 3
-        mock_client.get_pr_threads.return_value = [
+        mock_client.iter_pr_threads.return_value = [
             {
                 "id": i,
                 "status": "active",
@@ -214,7 +214,7 @@ class TestExtractComments:
         db.connection.commit()
 
         # Return thread with older timestamp (should be skipped)
-        mock_client.get_pr_threads.return_value = [
+        mock_client.iter_pr_threads.return_value = [
             {
                 "id": 1,
                 "status": "active",
@@ -244,7 +244,7 @@ class TestExtractComments:
         self, db: DatabaseManager, mock_client: MagicMock, mock_config: MagicMock
     ) -> None:
         """Test that comments are extracted from thread payloads."""
-        mock_client.get_pr_threads.return_value = [
+        mock_client.iter_pr_threads.return_value = [
             {
                 "id": 1,
                 "status": "active",
@@ -284,7 +284,7 @@ class TestExtractComments:
         from ado_git_repo_insights.extractor.ado_client import ExtractionError
 
         # First call fails, second succeeds
-        mock_client.get_pr_threads.side_effect = [
+        mock_client.iter_pr_threads.side_effect = [
             ExtractionError("API error"),
             [
                 {
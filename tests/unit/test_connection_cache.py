@@ -0,0 +1,73 @@
+"""Unit tests for the connection-validation cache in cmd_extract.
+
+A marker in the artifacts dir lets closely-spaced runs with the same
+org/PAT skip the test_connection round-trip. Invariant 19: only a
+fingerprint of the PAT is written, never the PAT itself.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from ado_git_repo_insights.cli import (
+    _CONN_CACHE_FILENAME,
+    _connection_fingerprint,
+    _connection_recently_validated,
+    _write_connection_marker,
+)
+
+
+def _make_config(organization: str = "test-org", pat: str = "test-pat") -> MagicMock:
+    config = MagicMock()
+    config.organization = organization
+    config.pat = pat
+    return config
+
+
+class TestConnectionCache:
+    """Tests for the on-disk connection-validation marker."""
+
+    def test_fresh_marker_skips_validation(self, tmp_path: Path) -> None:
+        """A marker written moments ago validates the same org/PAT pair."""
+        config = _make_config()
+        _write_connection_marker(config, tmp_path)
+
+        assert _connection_recently_validated(config, tmp_path) is True
+
+    def test_missing_marker_fails_open(self, tmp_path: Path) -> None:
+        """No marker means the real connection test must run."""
+        assert _connection_recently_validated(_make_config(), tmp_path) is False
+
+    def test_stale_marker_fails_open(self, tmp_path: Path) -> None:
+        """A marker older than the TTL does not skip validation."""
+        config = _make_config()
+        marker = tmp_path / _CONN_CACHE_FILENAME
+        stale = time.time() - 3600
+        marker.write_text(f"{_connection_fingerprint(config)}\t{stale}\n")
+
+        assert _connection_recently_validated(config, tmp_path) is False
+
+    def test_different_pat_fails_open(self, tmp_path: Path) -> None:
+        """Changing the PAT invalidates the cached fingerprint."""
+        _write_connection_marker(_make_config(pat="old-pat"), tmp_path)
+
+        assert (
+            _connection_recently_validated(_make_config(pat="new-pat"), tmp_path)
+            is False
+        )
+
+    def test_corrupt_marker_fails_open(self, tmp_path: Path) -> None:
+        """Unparseable marker content falls back to the real check."""
+        (tmp_path / _CONN_CACHE_FILENAME).write_text("not a valid marker")
+
+        assert _connection_recently_validated(_make_config(), tmp_path) is False
+
+    def test_marker_does_not_contain_pat(self, tmp_path: Path) -> None:
+        """Invariant 19: the PAT value never touches disk."""
+        config = _make_config(pat="super-secret-pat-value")
+        _write_connection_marker(config, tmp_path)
+
+        content = (tmp_path / _CONN_CACHE_FILENAME).read_text()
+        assert "super-secret-pat-value" not in content
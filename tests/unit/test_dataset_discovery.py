@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 
@@ -24,21 +25,42 @@ def temp_artifacts_dir(tmp_path: Path) -> Path:
     return tmp_path / "run_artifacts"
 
 
+@functools.lru_cache(maxsize=8)
+def _default_manifest_bytes(manifest_schema_version: int) -> bytes:
+    """Serialized default manifest, built once per schema version.
+
+    Most tests call create_manifest with the default rollup list, so the
+    common case reuses cached bytes instead of re-serializing per call.
+    """
+    manifest = {
+        "manifest_schema_version": manifest_schema_version,
+        "aggregate_index": {
+            "weekly_rollups": [{"path": "aggregates/weekly_rollups/2024-W01.json"}],
+            "distributions": [],
+        },
+    }
+    return json.dumps(manifest).encode("utf-8")
+
+
 def create_manifest(
     path: Path, manifest_schema_version: int = 1, weekly_rollups: list | None = None
 ) -> None:
     """Create a valid dataset-manifest.json file."""
     path.mkdir(parents=True, exist_ok=True)
+    manifest_path = path / "dataset-manifest.json"
+
+    if weekly_rollups is None:
+        manifest_path.write_bytes(_default_manifest_bytes(manifest_schema_version))
+        return
+
     manifest = {
         "manifest_schema_version": manifest_schema_version,
         "aggregate_index": {
-            "weekly_rollups": weekly_rollups
-            if weekly_rollups is not None
-            else [{"path": "aggregates/weekly_rollups/2024-W01.json"}],
+            "weekly_rollups": weekly_rollups,
             "distributions": [],
         },
     }
-    (path / "dataset-manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
 
 
 class TestFindDatasetRoots:
@@ -279,3 +301,20 @@ class TestValidateDatasetRoot:
 
         assert is_valid is True
         assert error is None
+
+    def test_rewritten_manifest_bypasses_parse_cache(self, tmp_path: Path) -> None:
+        """A rewritten manifest is re-read, not served from the parse cache."""
+        dataset_dir = tmp_path / "dataset"
+        create_manifest(dataset_dir)
+
+        is_valid, _ = validate_dataset_root(dataset_dir)
+        assert is_valid is True
+
+        # Rewriting changes st_mtime_ns, which keys the manifest parse cache
+        (dataset_dir / "dataset-manifest.json").write_text(
+            "not json", encoding="utf-8"
+        )
+
+        is_valid, error = validate_dataset_root(dataset_dir)
+        assert is_valid is False
+        assert "Invalid JSON" in error
@@ -11,6 +11,7 @@ Tests the extraction date range logic to prevent regressions:
 from __future__ import annotations
 
 from datetime import date as real_date
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -39,34 +40,43 @@ class FrozenDate(real_date):
         cls._frozen_today = frozen
 
 
+class _StubRepository:
+    """Minimal PRRepository stand-in: only the method these tests exercise."""
+
+    def __init__(self, last_extraction_date: real_date | None) -> None:
+        self._last_extraction_date = last_extraction_date
+
+    def get_last_extraction_date(
+        self, *args: object, **kwargs: object
+    ) -> real_date | None:
+        return self._last_extraction_date
+
+
 def create_extractor_with_mocks(
     config_end_date: real_date | None = None,
     config_start_date: real_date | None = None,
     last_extraction_date: real_date | None = None,
 ) -> PRExtractor:
-    """Create a PRExtractor with mocked dependencies for testing."""
-    from ado_git_repo_insights.extractor.pr_extractor import PRExtractor
+    """Create a PRExtractor with lightweight stub dependencies for testing.
 
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.date_range.end = config_end_date
-    mock_config.date_range.start = config_start_date
-    mock_config.organization = "TestOrg"
-    mock_config.projects = ["TestProject"]
-    mock_config.api = MagicMock()
+    No test here asserts on call records, so plain SimpleNamespace stubs
+    stand in for config/client/db instead of heavier MagicMock trees.
+    """
+    from ado_git_repo_insights.extractor.pr_extractor import PRExtractor
 
-    # Mock database and repository
-    mock_db = MagicMock()
-    mock_repository = MagicMock()
-    mock_repository.get_last_extraction_date.return_value = last_extraction_date
+    config = SimpleNamespace(
+        date_range=SimpleNamespace(end=config_end_date, start=config_start_date),
+        organization="TestOrg",
+        projects=["TestProject"],
+        api=SimpleNamespace(),
+    )
 
-    # Create extractor
     extractor = PRExtractor(
-        client=MagicMock(),
-        db=mock_db,
-        config=mock_config,
+        client=SimpleNamespace(),  # type: ignore[arg-type]
+        db=SimpleNamespace(),  # type: ignore[arg-type]
+        config=config,  # type: ignore[arg-type]
     )
-    extractor.repository = mock_repository
+    extractor.repository = _StubRepository(last_extraction_date)  # type: ignore[assignment]
 
     return extractor
 
@@ -11,26 +11,27 @@ from __future__ import annotations
 
 import json
 import sys
-from datetime import date, datetime
+from datetime import datetime
 from pathlib import Path
 from types import ModuleType
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from ado_git_repo_insights.ml.forecaster import (
+    GENERATOR_ID,
+    METRICS,
+    PREDICTIONS_SCHEMA_VERSION,
+    ProphetForecaster,
+)
 
-class TestForecasterContract:
-    """Schema contract validation for predictions/trends.json."""
 
-    @pytest.fixture
-    def mock_db(self) -> Mock:
-        """Mock database with sample PR data spanning multiple weeks."""
-        db = Mock()
-        db.connection = Mock()
-
-        # Mock SQL query result - data spanning 3+ weeks to meet forecaster requirements
-        df_data = {
+def _sample_pr_frame() -> pd.DataFrame:
+    """Sample PR data spanning 3+ weeks to meet forecaster requirements."""
+    return pd.DataFrame(
+        {
             "closed_date": [
                 "2026-01-06",  # Week 1
                 "2026-01-07",
@@ -52,60 +53,63 @@ class TestForecasterContract:
                 170.0,
             ],
         }
+    )
+
+
+def _build_fake_prophet_module() -> ModuleType:
+    """Create a fake prophet module whose model gives deterministic predictions."""
+    mock_model_instance = MagicMock()
+
+    # Mock forecast result
+    mock_forecast = pd.DataFrame(
+        {
+            "ds": pd.to_datetime(
+                ["2026-01-27", "2026-02-03", "2026-02-10", "2026-02-17"]
+            ),
+            "yhat": [25.0, 27.0, 26.0, 28.0],
+            "yhat_lower": [20.0, 22.0, 21.0, 23.0],
+            "yhat_upper": [30.0, 32.0, 31.0, 33.0],
+        }
+    )
 
-        with patch("pandas.read_sql_query", return_value=pd.DataFrame(df_data)):
-            yield db
-
-    @pytest.fixture
-    def mock_prophet_class(self) -> MagicMock:
-        """Mock Prophet class with deterministic predictions."""
-        mock_model_instance = MagicMock()
-
-        # Mock forecast result
-        mock_forecast = pd.DataFrame(
-            {
-                "ds": pd.to_datetime(
-                    ["2026-01-27", "2026-02-03", "2026-02-10", "2026-02-17"]
-                ),
-                "yhat": [25.0, 27.0, 26.0, 28.0],
-                "yhat_lower": [20.0, 22.0, 21.0, 23.0],
-                "yhat_upper": [30.0, 32.0, 31.0, 33.0],
-            }
-        )
+    mock_model_instance.predict.return_value = mock_forecast
+    mock_model_instance.fit.return_value = mock_model_instance
 
-        mock_model_instance.predict.return_value = mock_forecast
-        mock_model_instance.fit.return_value = mock_model_instance
+    fake_module = ModuleType("prophet")
+    # Class that when instantiated returns the mock instance
+    fake_module.Prophet = MagicMock(return_value=mock_model_instance)  # type: ignore[attr-defined]
+    return fake_module
 
-        # Return a class that when instantiated returns the mock instance
-        mock_class = MagicMock(return_value=mock_model_instance)
-        return mock_class
 
-    @pytest.fixture
-    def fake_prophet_module(self, mock_prophet_class: MagicMock) -> ModuleType:
-        """Create a fake prophet module with mock Prophet class."""
-        fake_module = ModuleType("prophet")
-        fake_module.Prophet = mock_prophet_class  # type: ignore[attr-defined]
-        return fake_module
+@pytest.fixture(scope="module")
+def contract_output(tmp_path_factory: pytest.TempPathFactory) -> dict:
+    """Run the forecaster once and cache the parsed predictions.
 
-    def test_predictions_schema_structure(
-        self, mock_db: Mock, fake_prophet_module: ModuleType, tmp_path: Path
-    ) -> None:
-        """Predictions JSON has exact required structure."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
+    Every contract test asserts against the same trends.json, so one shared
+    generate() run replaces six identical generate-then-load setups.
+    """
+    output_dir = tmp_path_factory.mktemp("contract_output")
+    mock_db = Mock()
+    mock_db.connection = Mock()
 
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=mock_db, output_dir=tmp_path)
-            success = forecaster.generate()
+    with (
+        patch("pandas.read_sql_query", return_value=_sample_pr_frame()),
+        patch.dict(sys.modules, {"prophet": _build_fake_prophet_module()}),
+    ):
+        forecaster = ProphetForecaster(db=mock_db, output_dir=output_dir)
+        assert forecaster.generate() is True
 
-        assert success is True
+    predictions_file = output_dir / "predictions" / "trends.json"
+    assert predictions_file.exists()
+    return json.loads(predictions_file.read_text(encoding="utf-8"))
 
-        # Verify file exists
-        predictions_file = tmp_path / "predictions" / "trends.json"
-        assert predictions_file.exists()
 
-        # Load and validate structure
-        with predictions_file.open("r") as f:
-            data = json.load(f)
+class TestForecasterContract:
+    """Schema contract validation for predictions/trends.json."""
+
+    def test_predictions_schema_structure(self, contract_output: dict) -> None:
+        """Predictions JSON has exact required structure."""
+        data = contract_output
 
         # Root fields
         assert "schema_version" in data
@@ -121,23 +125,9 @@ class TestForecasterContract:
         assert isinstance(data["generated_by"], str)
         assert isinstance(data["forecasts"], list)
 
-    def test_predictions_contract_values(
-        self, mock_db: Mock, fake_prophet_module: ModuleType, tmp_path: Path
-    ) -> None:
+    def test_predictions_contract_values(self, contract_output: dict) -> None:
         """Predictions JSON has exact contract-compliant values."""
-        from ado_git_repo_insights.ml.forecaster import (
-            GENERATOR_ID,
-            PREDICTIONS_SCHEMA_VERSION,
-            ProphetForecaster,
-        )
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=mock_db, output_dir=tmp_path)
-            forecaster.generate()
-
-        predictions_file = tmp_path / "predictions" / "trends.json"
-        with predictions_file.open("r") as f:
-            data = json.load(f)
+        data = contract_output
 
         # Contract values
         assert data["schema_version"] == PREDICTIONS_SCHEMA_VERSION
@@ -148,12 +138,8 @@ class TestForecasterContract:
         # Timestamp format
         datetime.fromisoformat(data["generated_at"])  # Should not raise
 
-    def test_forecast_metric_enums(
-        self, mock_db: Mock, fake_prophet_module: ModuleType, tmp_path: Path
-    ) -> None:
+    def test_forecast_metric_enums(self, contract_output: dict) -> None:
         """Forecast metrics match exact contract enums."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
         # Review time removed in US2 - only 2 metrics now
         valid_metrics = {"pr_throughput", "cycle_time_minutes"}
         metric_units = {
@@ -161,15 +147,7 @@ class TestForecasterContract:
             "cycle_time_minutes": "minutes",
         }
 
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=mock_db, output_dir=tmp_path)
-            forecaster.generate()
-
-        predictions_file = tmp_path / "predictions" / "trends.json"
-        with predictions_file.open("r") as f:
-            data = json.load(f)
-
-        for forecast in data["forecasts"]:
+        for forecast in contract_output["forecasts"]:
             # Metric enum validation
             assert forecast["metric"] in valid_metrics
 
@@ -180,40 +158,26 @@ class TestForecasterContract:
             assert "horizon_weeks" in forecast
             assert "values" in forecast
 
-    def test_period_start_monday_aligned(
-        self, mock_db: Mock, fake_prophet_module: ModuleType, tmp_path: Path
-    ) -> None:
+    def test_period_start_monday_aligned(self, contract_output: dict) -> None:
         """All period_start dates are Monday-aligned."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=mock_db, output_dir=tmp_path)
-            forecaster.generate()
-
-        predictions_file = tmp_path / "predictions" / "trends.json"
-        with predictions_file.open("r") as f:
-            data = json.load(f)
-
-        for forecast in data["forecasts"]:
-            for value in forecast["values"]:
-                period_start = date.fromisoformat(value["period_start"])
-                assert period_start.weekday() == 0, f"{period_start} is not a Monday"
+        starts = np.array(
+            [
+                value["period_start"]
+                for forecast in contract_output["forecasts"]
+                for value in forecast["values"]
+            ],
+            dtype="datetime64[D]",
+        )
+        # The datetime64 epoch (1970-01-01) is a Thursday, so a Monday
+        # satisfies (days_since_epoch - 4) % 7 == 0
+        not_monday = (starts.astype("int64") - 4) % 7 != 0
+        assert not not_monday.any(), (
+            f"period_start dates should be Monday: {starts[not_monday]}"
+        )
 
-    def test_forecast_value_fields(
-        self, mock_db: Mock, fake_prophet_module: ModuleType, tmp_path: Path
-    ) -> None:
+    def test_forecast_value_fields(self, contract_output: dict) -> None:
         """Forecast values have required bounds fields."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
-        with patch.dict(sys.modules, {"prophet": fake_prophet_module}):
-            forecaster = ProphetForecaster(db=mock_db, output_dir=tmp_path)
-            forecaster.generate()
-
-        predictions_file = tmp_path / "predictions" / "trends.json"
-        with predictions_file.open("r") as f:
-            data = json.load(f)
-
-        for forecast in data["forecasts"]:
+        for forecast in contract_output["forecasts"]:
             for value in forecast["values"]:
                 # Required fields
                 assert "period_start" in value
@@ -231,8 +195,6 @@ class TestForecasterContract:
 
     def test_empty_forecasts_valid(self, tmp_path: Path) -> None:
         """Empty forecasts array is valid (no data scenario)."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
         # Mock empty database
         mock_db = Mock()
         mock_db.connection = Mock()
@@ -244,8 +206,7 @@ class TestForecasterContract:
         assert success is True
 
         predictions_file = tmp_path / "predictions" / "trends.json"
-        with predictions_file.open("r") as f:
-            data = json.load(f)
+        data = json.loads(predictions_file.read_text(encoding="utf-8"))
 
         # Empty forecasts allowed
         assert data["forecasts"] == []
@@ -253,8 +214,6 @@ class TestForecasterContract:
 
     def test_prophet_import_failure_returns_false(self, tmp_path: Path) -> None:
         """Prophet import failure returns False without writing file."""
-        from ado_git_repo_insights.ml.forecaster import ProphetForecaster
-
         mock_db = Mock()
         mock_db.connection = Mock()
 
@@ -283,6 +242,12 @@ class TestForecasterContract:
         assert not predictions_file.exists()
 
 
+@pytest.fixture(scope="module")
+def metric_names() -> frozenset[str]:
+    """Configured metric names, built once for the membership checks."""
+    return frozenset(m[0] for m in METRICS)
+
+
 class TestProphetMetricsConfiguration:
     """Tests for Prophet METRICS configuration (US2 - Review Time Removal)."""
 
@@ -291,27 +256,19 @@ class TestProphetMetricsConfiguration:
 
         Review time was removed because it used cycle time as a misleading proxy.
         """
-        from ado_git_repo_insights.ml.forecaster import METRICS
-
         assert len(METRICS) == 2, f"Expected 2 metrics, got {len(METRICS)}"
 
-    def test_metrics_does_not_include_review_time(self) -> None:
-        """METRICS should not include review_time_minutes."""
-        from ado_git_repo_insights.ml.forecaster import METRICS
-
-        metric_names = [m[0] for m in METRICS]
-        assert "review_time_minutes" not in metric_names
-
-    def test_metrics_includes_pr_throughput(self) -> None:
-        """METRICS should include pr_throughput."""
-        from ado_git_repo_insights.ml.forecaster import METRICS
-
-        metric_names = [m[0] for m in METRICS]
-        assert "pr_throughput" in metric_names
-
-    def test_metrics_includes_cycle_time(self) -> None:
-        """METRICS should include cycle_time_minutes."""
-        from ado_git_repo_insights.ml.forecaster import METRICS
-
-        metric_names = [m[0] for m in METRICS]
-        assert "cycle_time_minutes" in metric_names
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("pr_throughput", True),
+            ("cycle_time_minutes", True),
+            # Review time was removed in US2
+            ("review_time_minutes", False),
+        ],
+    )
+    def test_metric_membership(
+        self, metric_names: frozenset[str], name: str, expected: bool
+    ) -> None:
+        """Membership in METRICS matches the post-US2 metric set."""
+        assert (name in metric_names) is expected
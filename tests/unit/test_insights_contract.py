@@ -31,17 +31,15 @@ class TestInsightsContract:
         # Mock PR stats queries
         def mock_execute(query: str) -> Mock:
             cursor = Mock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 42}
-            elif "MIN(closed_date)" in query:
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row
                 cursor.fetchone.return_value = {
+                    "completed_prs": 42,
                     "min_date": "2026-01-01T00:00:00Z",
                     "max_date": "2026-01-15T00:00:00Z",
+                    "avg_cycle": 240.5,
+                    "authors": 12,
                 }
-            elif "AVG(cycle_time_minutes)" in query:
-                cursor.fetchone.return_value = {"avg_cycle": 240.5, "max_cycle": 720.0}
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 12}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 3}
             elif "MAX(closed_date)" in query:
@@ -226,17 +226,15 @@ class TestCacheLogic:
 
         def mock_execute(query: str, *args: Any) -> MagicMock:
             cursor = MagicMock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 10}
-            elif "MIN(closed_date)" in query:
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row
                 cursor.fetchone.return_value = {
+                    "completed_prs": 10,
                     "min_date": "2026-01-01T00:00:00Z",
                     "max_date": "2026-01-15T00:00:00Z",
+                    "avg_cycle": 145.0,
+                    "authors": 5,
                 }
-            elif "AVG(cycle_time_minutes)" in query:
-                cursor.fetchone.return_value = {"avg_cycle": 145.0, "max_cycle": 200.0}
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 5}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 3}
             elif "MAX(closed_date)" in query:
@@ -348,6 +346,60 @@ class TestCacheLogic:
         assert result is not None
         assert result["insights"][0]["id"] == "test"
 
+    def test_cache_epoch_field_preferred_over_iso(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        """cached_at_epoch decides freshness without parsing the ISO string."""
+        import time
+
+        generator = LLMInsightsGenerator(
+            db=mock_db, output_dir=tmp_path, cache_ttl_hours=12
+        )
+
+        cache_path = tmp_path / "insights" / "cache.json"
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stale ISO timestamp but a fresh epoch - the epoch must win
+        stale_time = datetime.now(timezone.utc) - timedelta(hours=48)
+        cache_data = {
+            "cache_key": "test-key",
+            "cached_at": stale_time.isoformat(),
+            "cached_at_epoch": int(time.time()) - 3600,
+            "insights_data": {"insights": []},
+        }
+        with cache_path.open("w") as f:
+            json.dump(cache_data, f)
+
+        result = generator._check_cache(cache_path, "test-key")
+        assert result is not None
+
+    def test_repeat_generate_short_circuits(
+        self, mock_db: MagicMock, tmp_path: Path
+    ) -> None:
+        """Second generate() with unchanged DB markers skips the API path."""
+        generator = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
+
+        insights_data = {
+            "schema_version": 1,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "is_stub": False,
+            "generated_by": "openai-v1.0",
+            "insights": [],
+        }
+
+        with (
+            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
+            patch.object(
+                generator, "_call_openai", return_value=insights_data
+            ) as mock_call,
+        ):
+            assert generator.generate() is True
+            assert generator.generate() is True
+
+        # The freshness markers never moved, so only the first run
+        # should have reached the API layer
+        assert mock_call.call_count == 1
+
 
 class TestInsightsSchemaV2Contract:
     """Contract tests for insights-schema-v2 (T032)."""
@@ -474,16 +526,15 @@ class TestP90PercentileCalculation:
 
         def mock_execute(query: str, *args: Any) -> MagicMock:
             cursor = MagicMock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 100}
-            elif "MIN(closed_date)" in query:
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row
                 cursor.fetchone.return_value = {
+                    "completed_prs": 100,
                     "min_date": "2026-01-01T00:00:00Z",
                     "max_date": "2026-01-15T00:00:00Z",
+                    "avg_cycle": sum(cycle_times) / len(cycle_times),  # 505.0
+                    "authors": 10,
                 }
-            elif "AVG(cycle_time_minutes)" in query and "MAX" not in query:
-                avg_val = sum(cycle_times) / len(cycle_times)  # 505.0
-                cursor.fetchone.return_value = {"avg_cycle": avg_val}
             elif (
                 "NTILE" in query
                 or "ROW_NUMBER" in query
@@ -495,8 +546,6 @@ class TestP90PercentileCalculation:
             elif "ORDER BY cycle_time_minutes" in query:
                 # Fallback percentile calculation
                 cursor.fetchone.return_value = {"cycle_time_minutes": 900.0}
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 10}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 5}
             elif "MAX(closed_date)" in query:
@@ -533,16 +582,15 @@ class TestP90PercentileCalculation:
 
         def mock_execute(query: str, *args: Any) -> MagicMock:
             cursor = MagicMock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 10}
-            elif "MIN(closed_date)" in query:
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row
                 cursor.fetchone.return_value = {
+                    "completed_prs": 10,
                     "min_date": "2026-01-01T00:00:00Z",
                     "max_date": "2026-01-15T00:00:00Z",
+                    "avg_cycle": sum(cycle_times) / len(cycle_times),
+                    "authors": 5,
                 }
-            elif "AVG(cycle_time_minutes)" in query and "MAX" not in query:
-                avg_val = sum(cycle_times) / len(cycle_times)
-                cursor.fetchone.return_value = {"avg_cycle": avg_val}
             elif (
                 "NTILE" in query
                 or "ROW_NUMBER" in query
@@ -554,8 +602,6 @@ class TestP90PercentileCalculation:
                 cursor.fetchone.return_value = {"p90_cycle": 90.0}
             elif "ORDER BY cycle_time_minutes" in query:
                 cursor.fetchone.return_value = {"cycle_time_minutes": 90.0}
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 5}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 3}
             elif "MAX(closed_date)" in query:
@@ -587,15 +633,15 @@ class TestP90PercentileCalculation:
 
         def mock_execute(query: str, *args: Any) -> MagicMock:
             cursor = MagicMock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 3}
-            elif "MIN(closed_date)" in query:
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row
                 cursor.fetchone.return_value = {
+                    "completed_prs": 3,
                     "min_date": "2026-01-01T00:00:00Z",
                     "max_date": "2026-01-03T00:00:00Z",
+                    "avg_cycle": 200.0,
+                    "authors": 2,
                 }
-            elif "AVG(cycle_time_minutes)" in query and "MAX" not in query:
-                cursor.fetchone.return_value = {"avg_cycle": 200.0}
             elif (
                 "NTILE" in query
                 or "ROW_NUMBER" in query
@@ -605,8 +651,6 @@ class TestP90PercentileCalculation:
                 cursor.fetchone.return_value = {"p90_cycle": 300.0}
             elif "ORDER BY cycle_time_minutes" in query:
                 cursor.fetchone.return_value = {"cycle_time_minutes": 300.0}
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 2}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 1}
             elif "MAX(closed_date)" in query:
@@ -635,12 +679,15 @@ class TestP90PercentileCalculation:
 
         def mock_execute(query: str, *args: Any) -> MagicMock:
             cursor = MagicMock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 0}
-            elif "MIN(closed_date)" in query:
-                cursor.fetchone.return_value = {"min_date": None, "max_date": None}
-            elif "AVG(cycle_time_minutes)" in query:
-                cursor.fetchone.return_value = {"avg_cycle": None}
+            if "MIN(closed_date)" in query:
+                # Combined pull_requests aggregate row (empty table)
+                cursor.fetchone.return_value = {
+                    "completed_prs": None,
+                    "min_date": None,
+                    "max_date": None,
+                    "avg_cycle": None,
+                    "authors": 0,
+                }
             elif (
                 "NTILE" in query
                 or "ROW_NUMBER" in query
@@ -649,8 +696,6 @@ class TestP90PercentileCalculation:
                 cursor.fetchone.return_value = None
             elif "ORDER BY cycle_time_minutes" in query:
                 cursor.fetchone.return_value = None
-            elif "COUNT(DISTINCT user_id)" in query:
-                cursor.fetchone.return_value = {"cnt": 0}
             elif "COUNT(*)" in query and "repositories" in query:
                 cursor.fetchone.return_value = {"cnt": 0}
             elif "MAX(closed_date)" in query:
@@ -11,214 +11,213 @@ regardless of whether openai is installed.
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import re
 import sys
+from collections.abc import Callable
 from pathlib import Path
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
+from ado_git_repo_insights.ml.insights import LLMInsightsGenerator
+
+# Canned fetchone payloads per query shape, one set per scenario
+_EMPTY_ROWS = {
+    "aggregate": {
+        "completed_prs": None,
+        "min_date": None,
+        "max_date": None,
+        "avg_cycle": None,
+        "authors": 0,
+    },
+    "p90": None,
+    "repo_count": {"cnt": 0},
+    "markers": {"max_closed": None, "max_updated": None},
+    "default": {"cnt": 0},
+}
+
+_DATA_ROWS = {
+    "aggregate": {
+        "completed_prs": 50,
+        "min_date": "2026-01-01",
+        "max_date": "2026-01-15",
+        "avg_cycle": 300.0,
+        "authors": 10,
+    },
+    "p90": {"cycle_time_minutes": 810.0},
+    "repo_count": {"cnt": 3},
+    "markers": {"max_closed": "2026-01-15", "max_updated": "2026-01-15T12:00:00Z"},
+    "default": {"cnt": 0},
+}
+
+_EMPTY_RESPONSE = {
+    "insights": [
+        {
+            "id": "temp-1",
+            "category": "trend",
+            "severity": "info",
+            "title": "No data available",
+            "description": "Insufficient data for analysis",
+            "affected_entities": [],
+        }
+    ]
+}
+
+_DATA_RESPONSE = {
+    "insights": [
+        {
+            "id": "temp-1",
+            "category": "bottleneck",
+            "severity": "warning",
+            "title": "Test",
+            "description": "Test description",
+            "affected_entities": ["repo:test"],
+        },
+        {
+            "id": "temp-2",
+            "category": "anomaly",
+            "severity": "critical",
+            "title": "Test 2",
+            "description": "Test description 2",
+            "affected_entities": [],
+        },
+    ]
+}
+
+# Response payloads encoded once at import: every test reuses the same
+# immutable string instead of re-running json.dumps per test
+_SCENARIOS = {
+    "empty": (_EMPTY_ROWS, _EMPTY_RESPONSE, json.dumps(_EMPTY_RESPONSE)),
+    "with_data": (_DATA_ROWS, _DATA_RESPONSE, json.dumps(_DATA_RESPONSE)),
+}
+
+
+class _Cursor:
+    """Minimal cursor stand-in: fetchone() returns a fixed payload."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: dict | None) -> None:
+        self._payload = payload
+
+    def fetchone(self) -> dict | None:
+        return self._payload
+
+
+# One named group per query shape: the combined pull_requests aggregate,
+# the P90 percentile query, the repository count, and the freshness
+# markers. lastgroup tags the match for the cursor-table lookup.
+_QUERY_RE = re.compile(
+    r"(?P<aggregate>MIN\(closed_date\))"
+    r"|(?P<p90>ORDER BY cycle_time_minutes)"
+    r"|(?P<repo_count>COUNT\(\*\)[^;]*repositories)"
+    r"|(?P<markers>MAX\(closed_date\))"
+)
+
+
+def _make_execute(rows: dict) -> Callable[[str], _Cursor]:
+    """Build a db.execute stand-in: one regex match, one dict lookup.
+
+    The generator issues the same handful of query strings repeatedly, and
+    the cursors are stateless, so the dispatch is memoized per query text —
+    each unique query pays for the regex scan exactly once.
+    """
+    cursors = {tag: _Cursor(payload) for tag, payload in rows.items()}
+
+    @functools.cache
+    def mock_execute(query: str) -> _Cursor:
+        match = _QUERY_RE.search(query)
+        return cursors[match.lastgroup if match else "default"]
+
+    return mock_execute
+
+
+class _StubCompletions:
+    """chat.completions stand-in: create() returns a fixed response."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: SimpleNamespace) -> None:
+        self._response = response
+
+    def create(self, **_kwargs: object) -> SimpleNamespace:
+        return self._response
+
+
+class _StubClient:
+    """OpenAI client stand-in with plain attributes instead of Mock chains."""
+
+    __slots__ = ("chat",)
+
+    def __init__(self, content: str) -> None:
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+        self.chat = SimpleNamespace(completions=_StubCompletions(response))
+
+
+def _make_openai_module(response_json: str) -> ModuleType:
+    """Fake openai module whose client returns the pre-encoded JSON response."""
+    fake_openai = ModuleType("openai")
+    client = _StubClient(response_json)
+    fake_openai.OpenAI = lambda **_kwargs: client  # type: ignore[attr-defined]
+    return fake_openai
+
 
 class TestEdgeCaseIDStability:
     """ID stability edge-case tests (Phase 5 hardening)."""
 
-    def test_id_stability_empty_dataset(self, tmp_path: Path) -> None:
-        """IDs are deterministic even with empty dataset."""
-        from ado_git_repo_insights.ml.insights import LLMInsightsGenerator
+    @pytest.mark.parametrize("scenario", list(_SCENARIOS))
+    def test_id_stability(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, scenario: str
+    ) -> None:
+        """IDs are deterministic for fixed markers and payload in every scenario."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        rows, response_data, response_json = _SCENARIOS[scenario]
 
-        # Mock database with NO pull requests
         mock_db = Mock()
-
-        def mock_execute(query: str) -> Mock:
-            cursor = Mock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 0}
-            elif "MIN(closed_date)" in query:
-                cursor.fetchone.return_value = {"min_date": None, "max_date": None}
-            elif "ORDER BY cycle_time_minutes" in query:
-                # P90 percentile query - empty dataset returns None
-                cursor.fetchone.return_value = None
-            elif "AVG(cycle_time_minutes)" in query:
-                cursor.fetchone.return_value = {"avg_cycle": 0}
-            elif "COUNT(DISTINCT" in query:
-                cursor.fetchone.return_value = {"cnt": 0}
-            elif "COUNT(*)" in query and "repositories" in query:
-                cursor.fetchone.return_value = {"cnt": 0}
-            elif "MAX(closed_date)" in query:
-                # Empty dataset returns None
-                cursor.fetchone.return_value = {"max_closed": None, "max_updated": None}
-            else:
-                # Default fallback with empty cnt
-                cursor.fetchone.return_value = {"cnt": 0}
-            return cursor
-
-        mock_db.execute = mock_execute
-
-        # Mock OpenAI response
-        mock_response_data = {
-            "insights": [
-                {
-                    "id": "temp-1",
-                    "category": "trend",
-                    "severity": "info",
-                    "title": "No data available",
-                    "description": "Insufficient data for analysis",
-                    "affected_entities": [],
-                }
+        mock_db.execute = _make_execute(rows)
+        fake_openai = _make_openai_module(response_json)
+
+        with patch.dict(sys.modules, {"openai": fake_openai}):
+            gen = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
+            gen.generate()
+
+            # ID derivation is a pure function of (freshness markers,
+            # payload): two direct calls on identical inputs must agree,
+            # without paying for a second full pipeline run
+            max_closed, max_updated = gen._get_freshness()
+            ids_per_call = [
+                [
+                    insight["id"]
+                    for insight in gen._validate_and_fix_insights(
+                        copy.deepcopy(response_data), max_closed, max_updated
+                    )["insights"]
+                ]
+                for _ in range(2)
             ]
-        }
 
-        # Create fake openai module
-        fake_openai = ModuleType("openai")
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps(mock_response_data)
-        mock_client.chat.completions.create.return_value = mock_response
-        fake_openai.OpenAI = Mock(return_value=mock_client)  # type: ignore[attr-defined]
-
-        # Generate twice with same empty dataset
-        with (
-            patch.dict(sys.modules, {"openai": fake_openai}),
-            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
-        ):
-            # First run
-            gen1 = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
-            gen1.generate()
-
-            insights_file = tmp_path / "insights" / "summary.json"
-            with insights_file.open("r") as f:
-                data1 = json.load(f)
-            ids_run1 = [insight["id"] for insight in data1["insights"]]
-
-            # Clear cache and output for second run
-            cache_file = tmp_path / "insights" / "cache.json"
-            if cache_file.exists():
-                cache_file.unlink()
-            insights_file.unlink()
-
-            # Second run with same data
-            gen2 = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
-            gen2.generate()
-
-            with insights_file.open("r") as f:
-                data2 = json.load(f)
-            ids_run2 = [insight["id"] for insight in data2["insights"]]
-
-        # IDs must be identical for empty dataset
-        assert ids_run1 == ids_run2, "IDs changed across runs with empty dataset"
-
-        # IDs should use deterministic "empty-dataset" marker
-        for id_val in ids_run1:
-            assert id_val.startswith("trend-"), "ID should start with category"
-
-    def test_id_stability_with_data(self, tmp_path: Path) -> None:
-        """IDs are stable across repeated runs with identical DB markers."""
-        from ado_git_repo_insights.ml.insights import LLMInsightsGenerator
-
-        # Mock database with consistent data
-        mock_db = Mock()
-
-        def mock_execute(query: str) -> Mock:
-            cursor = Mock()
-            if "COUNT(*)" in query and "completed" in query:
-                cursor.fetchone.return_value = {"cnt": 50}
-            elif "MIN(closed_date)" in query:
-                cursor.fetchone.return_value = {
-                    "min_date": "2026-01-01",
-                    "max_date": "2026-01-15",
-                }
-            elif "ORDER BY cycle_time_minutes" in query:
-                # P90 percentile query - return 90th percentile value
-                cursor.fetchone.return_value = {"cycle_time_minutes": 810.0}
-            elif "AVG(cycle_time_minutes)" in query:
-                cursor.fetchone.return_value = {"avg_cycle": 300.0}
-            elif "COUNT(DISTINCT" in query:
-                cursor.fetchone.return_value = {"cnt": 10}
-            elif "COUNT(*)" in query and "repositories" in query:
-                cursor.fetchone.return_value = {"cnt": 3}
-            elif "MAX(closed_date)" in query:
-                # Stable markers
-                cursor.fetchone.return_value = {
-                    "max_closed": "2026-01-15",
-                    "max_updated": "2026-01-15T12:00:00Z",
-                }
-            else:
-                # Default fallback
-                cursor.fetchone.return_value = {"cnt": 0}
-            return cursor
-
-        mock_db.execute = mock_execute
-
-        # Mock OpenAI response
-        mock_response_data = {
-            "insights": [
-                {
-                    "id": "temp-1",
-                    "category": "bottleneck",
-                    "severity": "warning",
-                    "title": "Test",
-                    "description": "Test description",
-                    "affected_entities": ["repo:test"],
-                },
-                {
-                    "id": "temp-2",
-                    "category": "anomaly",
-                    "severity": "critical",
-                    "title": "Test 2",
-                    "description": "Test description 2",
-                    "affected_entities": [],
-                },
-            ]
-        }
+        assert ids_per_call[0] == ids_per_call[1], (
+            f"IDs changed across derivations ({scenario} scenario)"
+        )
 
-        # Create fake openai module
-        fake_openai = ModuleType("openai")
-        mock_client = Mock()
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = json.dumps(mock_response_data)
-        mock_client.chat.completions.create.return_value = mock_response
-        fake_openai.OpenAI = Mock(return_value=mock_client)  # type: ignore[attr-defined]
-
-        # Generate twice with same data
-        with (
-            patch.dict(sys.modules, {"openai": fake_openai}),
-            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
-        ):
-            # First run
-            gen1 = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
-            gen1.generate()
-
-            insights_file = tmp_path / "insights" / "summary.json"
-            with insights_file.open("r") as f:
-                data1 = json.load(f)
-            ids_run1 = [insight["id"] for insight in data1["insights"]]
-
-            # Clear cache and output for second run
-            cache_file = tmp_path / "insights" / "cache.json"
-            if cache_file.exists():
-                cache_file.unlink()
-            insights_file.unlink()
-
-            # Second run with identical DB markers
-            gen2 = LLMInsightsGenerator(db=mock_db, output_dir=tmp_path)
-            gen2.generate()
-
-            with insights_file.open("r") as f:
-                data2 = json.load(f)
-            ids_run2 = [insight["id"] for insight in data2["insights"]]
-
-        # IDs must be identical across runs
-        assert ids_run1 == ids_run2, "IDs changed across runs with identical data"
+        # The end-to-end run must write the same IDs the direct derivation
+        # produced
+        insights_file = tmp_path / "insights" / "summary.json"
+        data = json.loads(insights_file.read_text(encoding="utf-8"))
+        assert [insight["id"] for insight in data["insights"]] == ids_per_call[0]
 
         # Verify format: category-{hash}
         # Note: Insights are sorted by severity (critical > warning > info),
-        # so we cannot assume the order matches mock_response_data.
+        # so we cannot assume the order matches the mocked response.
         # Instead, verify each insight's ID starts with its category.
-        for insight in data1["insights"]:
+        for insight in data["insights"]:
             id_val = insight["id"]
-            category = insight["category"]
-            expected_prefix = category + "-"
+            expected_prefix = insight["category"] + "-"
             assert id_val.startswith(expected_prefix), (
                 f"ID '{id_val}' should start with '{expected_prefix}'"
             )
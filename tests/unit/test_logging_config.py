@@ -1,9 +1,11 @@
 """Tests for logging_config module."""
 
 import logging
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 from ado_git_repo_insights.utils.logging_config import (
     JsonlHandler,
     LoggingConfig,
@@ -12,41 +14,64 @@ from ado_git_repo_insights.utils.logging_config import (
     setup_logging,
 )
 
+# 52 alphanumeric chars matches the Azure DevOps PAT redaction pattern
+_FAKE_PAT = "a" * 52
+
+
+@pytest.fixture(scope="module")
+def redaction_config() -> RedactionConfig:
+    """One default RedactionConfig shared by the read-only redaction tests."""
+    return RedactionConfig()
+
+
+def _make_record(
+    msg: str,
+    *,
+    name: str = "test",
+    level: int = logging.INFO,
+    args: tuple = (),
+    exc_info: object = None,
+) -> logging.LogRecord:
+    """Build a LogRecord without repeating the full constructor per test."""
+    return logging.LogRecord(
+        name=name,
+        level=level,
+        pathname="",
+        lineno=0,
+        msg=msg,
+        args=args,
+        exc_info=exc_info,  # type: ignore[arg-type]
+    )
+
 
 class TestRedactionConfig:
     """Tests for RedactionConfig."""
 
-    def test_should_redact_key_true(self) -> None:
-        config = RedactionConfig()
-        assert config.should_redact_key("pat")
-        assert config.should_redact_key("PAT")
-        assert config.should_redact_key("auth_header")
-        assert config.should_redact_key("password")
-
-    def test_should_redact_key_false(self) -> None:
-        config = RedactionConfig()
-        assert not config.should_redact_key("auth_mode")
-        assert not config.should_redact_key("username")
-        assert not config.should_redact_key("project")
-
-    def test_redact_value_with_pat(self) -> None:
-        config = RedactionConfig()
-        pat = "a" * 52  # 52-char ADO PAT
-        result = config.redact_value(f"Using PAT: {pat}")
+    def test_should_redact_key_true(self, redaction_config: RedactionConfig) -> None:
+        assert redaction_config.should_redact_key("pat")
+        assert redaction_config.should_redact_key("PAT")
+        assert redaction_config.should_redact_key("auth_header")
+        assert redaction_config.should_redact_key("password")
+
+    def test_should_redact_key_false(self, redaction_config: RedactionConfig) -> None:
+        assert not redaction_config.should_redact_key("auth_mode")
+        assert not redaction_config.should_redact_key("username")
+        assert not redaction_config.should_redact_key("project")
+
+    def test_redact_value_with_pat(self, redaction_config: RedactionConfig) -> None:
+        result = redaction_config.redact_value(f"Using PAT: {_FAKE_PAT}")
         assert "***REDACTED***" in result
-        assert pat not in result
+        assert _FAKE_PAT not in result
 
-    def test_redact_value_with_bearer(self) -> None:
-        config = RedactionConfig()
-        result = config.redact_value(
+    def test_redact_value_with_bearer(self, redaction_config: RedactionConfig) -> None:
+        result = redaction_config.redact_value(
             "Auth: Bearer eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
         )
         assert "***REDACTED***" in result
 
-    def test_redact_value_safe_string(self) -> None:
-        config = RedactionConfig()
+    def test_redact_value_safe_string(self, redaction_config: RedactionConfig) -> None:
         safe = "Just a normal log message"
-        assert config.redact_value(safe) == safe
+        assert redaction_config.redact_value(safe) == safe
 
 
 class TestRedactingFormatter:
@@ -54,15 +79,7 @@ class TestRedactingFormatter:
 
     def test_format_redacts_message(self) -> None:
         formatter = RedactingFormatter("%(message)s")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="PAT: " + "a" * 52,
-            args=(),
-            exc_info=None,
-        )
+        record = _make_record("PAT: " + _FAKE_PAT)
         result = formatter.format(record)
         assert "***REDACTED***" in result
 
@@ -70,47 +87,27 @@ class TestRedactingFormatter:
 class TestJsonlHandler:
     """Tests for JsonlHandler."""
 
-    def test_emit_writes_jsonl(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log.jsonl"
-            handler = JsonlHandler(log_file)
-
-            record = logging.LogRecord(
-                name="test.logger",
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg="Test message",
-                args=(),
-                exc_info=None,
-            )
-            handler.emit(record)
-
-            assert log_file.exists()
-            content = log_file.read_text()
-            assert "Test message" in content
-            assert "test.logger" in content
-
-    def test_emit_redacts_secrets(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log.jsonl"
-            handler = JsonlHandler(log_file)
-            pat = "a" * 52
-
-            record = logging.LogRecord(
-                name="test",
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg=f"Using PAT: {pat}",
-                args=(),
-                exc_info=None,
-            )
-            handler.emit(record)
-
-            content = log_file.read_text()
-            assert "***REDACTED***" in content
-            assert pat not in content
+    def test_emit_writes_jsonl(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log.jsonl"
+        handler = JsonlHandler(log_file)
+
+        record = _make_record("Test message", name="test.logger")
+        handler.emit(record)
+
+        assert log_file.exists()
+        content = log_file.read_text()
+        assert "Test message" in content
+        assert "test.logger" in content
+
+    def test_emit_redacts_secrets(self, tmp_path: Path) -> None:
+        log_file = tmp_path / "test.log.jsonl"
+        handler = JsonlHandler(log_file)
+        record = _make_record(f"Using PAT: {_FAKE_PAT}")
+        handler.emit(record)
+
+        content = log_file.read_text()
+        assert "***REDACTED***" in content
+        assert _FAKE_PAT not in content
 
 
 class TestLoggingConfig:
@@ -125,100 +122,84 @@ class TestLoggingConfig:
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
+    @pytest.fixture(autouse=True)
+    def _restore_root_handlers(self) -> Iterator[None]:
+        """Save root-logger handlers and restore them after each test.
+
+        setup_logging() clears and replaces the root handlers; without this
+        the replacement handlers (and their open files) leak into later tests.
+        """
+        root = logging.getLogger()
+        saved = root.handlers[:]
+        yield
+        for handler in root.handlers:
+            if handler not in saved:
+                handler.close()
+        root.handlers.clear()
+        root.handlers.extend(saved)
+
     def test_setup_console_logging(self) -> None:
         config = LoggingConfig(format="console")
         setup_logging(config)
         root = logging.getLogger()
         assert len(root.handlers) >= 1
 
-    def test_setup_jsonl_logging(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = LoggingConfig(
-                format="jsonl",
-                artifacts_dir=Path(tmpdir),
-            )
-            setup_logging(config)
-            root = logging.getLogger()
-            assert len(root.handlers) >= 1
+    def test_setup_jsonl_logging(self, tmp_path: Path) -> None:
+        config = LoggingConfig(
+            format="jsonl",
+            artifacts_dir=tmp_path,
+        )
+        setup_logging(config)
+        root = logging.getLogger()
+        assert len(root.handlers) >= 1
 
 
 class TestJsonlRedactionStructuredFields:
     """Tests for JSONL redaction across message, exception, and structured fields."""
 
-    def test_jsonl_redacts_exception_traceback(self) -> None:
+    def test_jsonl_redacts_exception_traceback(self, tmp_path: Path) -> None:
         """JSONL handler redacts secrets appearing in exception tracebacks."""
         import sys
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log.jsonl"
-            handler = JsonlHandler(log_file)
-            pat = "a" * 52
-
-            # Create an exception containing the PAT
-            try:
-                raise ValueError(f"Auth failed with PAT: {pat}")
-            except ValueError:
-                exc_info = sys.exc_info()
-
-            record = logging.LogRecord(
-                name="test",
-                level=logging.ERROR,
-                pathname="",
-                lineno=0,
-                msg="Exception occurred",
-                args=(),
-                exc_info=exc_info,
-            )
-            handler.emit(record)
-
-            content = log_file.read_text()
-            # PAT should not appear anywhere in the output
-            assert pat not in content
-
-    def test_jsonl_redacts_structured_extra_fields(self) -> None:
+        log_file = tmp_path / "test.log.jsonl"
+        handler = JsonlHandler(log_file)
+        # Create an exception containing the PAT
+        try:
+            raise ValueError(f"Auth failed with PAT: {_FAKE_PAT}")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        record = _make_record(
+            "Exception occurred", level=logging.ERROR, exc_info=exc_info
+        )
+        handler.emit(record)
+
+        content = log_file.read_text()
+        # PAT should not appear anywhere in the output
+        assert _FAKE_PAT not in content
+
+    def test_jsonl_redacts_structured_extra_fields(self, tmp_path: Path) -> None:
         """JSONL handler redacts secrets in structured extra attributes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log.jsonl"
-            handler = JsonlHandler(log_file)
-            pat = "a" * 52
-
-            record = logging.LogRecord(
-                name="test",
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg="Processing request",
-                args=(),
-                exc_info=None,
-            )
-            # Add structured extra field containing a secret
-            record.auth_token = pat
-            record.bearer = f"Bearer {pat}"
-
-            handler.emit(record)
-
-            content = log_file.read_text()
-            # PAT should be redacted even in structured fields
-            assert pat not in content
-
-    def test_jsonl_redacts_nested_dict_in_args(self) -> None:
+        log_file = tmp_path / "test.log.jsonl"
+        handler = JsonlHandler(log_file)
+        record = _make_record("Processing request")
+        # Add structured extra field containing a secret
+        record.auth_token = _FAKE_PAT
+        record.bearer = f"Bearer {_FAKE_PAT}"
+
+        handler.emit(record)
+
+        content = log_file.read_text()
+        # PAT should be redacted even in structured fields
+        assert _FAKE_PAT not in content
+
+    def test_jsonl_redacts_nested_dict_in_args(self, tmp_path: Path) -> None:
         """JSONL handler redacts secrets in message args."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log.jsonl"
-            handler = JsonlHandler(log_file)
-            pat = "a" * 52
-
-            record = logging.LogRecord(
-                name="test",
-                level=logging.INFO,
-                pathname="",
-                lineno=0,
-                msg="Config: %s",
-                args=({"pat": pat, "org": "TestOrg"},),
-                exc_info=None,
-            )
-            handler.emit(record)
-
-            content = log_file.read_text()
-            # PAT should not appear in serialized output
-            assert pat not in content
+        log_file = tmp_path / "test.log.jsonl"
+        handler = JsonlHandler(log_file)
+        record = _make_record("Config: %s", args=({"pat": _FAKE_PAT, "org": "TestOrg"},))
+        handler.emit(record)
+
+        content = log_file.read_text()
+        # PAT should not appear in serialized output
+        assert _FAKE_PAT not in content
@@ -73,3 +73,26 @@ class TestOptionalDepsIsolation:
 
         # prophet should NOT be in new modules (lazy import)
         assert "prophet" not in new_modules, "prophet was imported at module load time"
+
+    def test_cli_import_stays_light(self) -> None:
+        """Importing the CLI module does not drag in heavy subsystem deps.
+
+        The cmd_* handlers import extractor/persistence/transform (and
+        their transitive deps) inside their bodies, so --help and
+        unrelated subcommands pay none of that import cost.
+        """
+        heavy = ("pandas", "numpy", "requests", "sqlite3", "yaml")
+        code = (
+            "import sys\n"
+            "import ado_git_repo_insights.cli\n"
+            f"loaded = [m for m in {heavy!r} if m in sys.modules]\n"
+            "assert not loaded, f'heavy modules imported: {loaded}'\n"
+        )
+        # Subprocess gives a clean sys.modules regardless of test order
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, result.stderr